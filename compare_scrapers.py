@@ -2,41 +2,44 @@
 """Utility script to compare original vs modular scraper performance."""
 
 import asyncio
-import time
-import subprocess
 import sys
+import time
 from pathlib import Path
 
+from main_modular import main as main_modular
+from scraper import main as main_original
 
-async def run_command(cmd, description):
-    """Run a command and measure execution time."""
+
+async def run_scraper(entry_point, argv, description):
+    """Run a scraper's main() in-process and measure execution time."""
     print(f"\n🚀 {description}")
     print("=" * 50)
 
-    start_time = time.time()
+    # Both entry points read their options from sys.argv
+    saved_argv = sys.argv
+    sys.argv = argv
+    start_time = time.perf_counter()
 
     try:
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, timeout=300
-        )
-        end_time = time.time()
-        duration = end_time - start_time
-
-        if result.returncode == 0:
-            print(f"✅ Success! Duration: {duration:.2f}s")
-            print("Output:")
-            print(result.stdout[-500:])  # Last 500 characters
-        else:
-            print(f"❌ Failed! Duration: {duration:.2f}s")
-            print("Error:")
-            print(result.stderr)
+        await asyncio.wait_for(entry_point(), timeout=300)
+        duration = time.perf_counter() - start_time
+        print(f"✅ Success! Duration: {duration:.2f}s")
+        return duration, True
 
-        return duration, result.returncode == 0
-
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print("⏰ Timeout after 5 minutes")
         return 300, False
 
+    except (Exception, SystemExit) as e:
+        duration = time.perf_counter() - start_time
+        print(f"❌ Failed! Duration: {duration:.2f}s")
+        print("Error:")
+        print(repr(e))
+        return duration, False
+
+    finally:
+        sys.argv = saved_argv
+
 
 async def main():
     """Compare both scrapers."""
@@ -44,18 +47,40 @@ async def main():
     print("Testing with 20 items each...")
 
     # Original scraper
-    original_cmd = 'python scraper.py --seed-url "https://doisporum.net/" --max-items 20 --csv-path "compare_original.csv" --jsonl-path "compare_original.jsonl"'
-    original_duration, original_success = await run_command(
-        original_cmd, "Running Original Scraper"
+    original_argv = [
+        "scraper.py",
+        "--seed-url",
+        "https://doisporum.net/",
+        "--max-items",
+        "20",
+        "--format",
+        "csv",
+        "--csv-path",
+        "compare_original.csv",
+        "--jsonl-path",
+        "compare_original.jsonl",
+    ]
+    original_duration, original_success = await run_scraper(
+        main_original, original_argv, "Running Original Scraper"
     )
 
     # Wait a bit between tests
     await asyncio.sleep(2)
 
     # Modular scraper
-    modular_cmd = 'python main_modular.py --seed-url "https://doisporum.net/" --max-items 20 --csv-path "compare_modular.csv" --jsonl-path "compare_modular.jsonl"'
-    modular_duration, modular_success = await run_command(
-        modular_cmd, "Running Modular Scraper"
+    modular_argv = [
+        "main_modular.py",
+        "--seed-url",
+        "https://doisporum.net/",
+        "--max-items",
+        "20",
+        "--csv-path",
+        "compare_modular.csv",
+        "--jsonl-path",
+        "compare_modular.jsonl",
+    ]
+    modular_duration, modular_success = await run_scraper(
+        main_modular, modular_argv, "Running Modular Scraper"
     )
 
     # Summary
@@ -78,9 +103,7 @@ async def main():
             slowdown = (
                 (modular_duration - original_duration) / original_duration
             ) * 100
-            print(
-                f"⚠️  Modular is {slowdown:.1f}% slower (expected due to import overhead)"
-            )
+            print(f"⚠️  Modular is {slowdown:.1f}% slower")
         else:
             print("⚖️  Both scrapers have similar performance")
 
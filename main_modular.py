@@ -5,7 +5,7 @@ Web scraper for doisporum.net offers following SOLID principles.
 Setup with uv:
     uv venv
     source .venv/bin/activate  # (Windows: .venv\\Scripts\\activate)
-    uv add "httpx[http2]==0.28.1" beautifulsoup4 lxml pandas tqdm
+    uv add "httpx[http2]==0.28.1" lxml tqdm
 
 Usage:
     uv run python main.py --seed-url "https://doisporum.net/" --max-items 120
@@ -16,8 +16,9 @@ import asyncio
 import logging
 
 from poc.src.app.partners.doisporum.parser import DoisPorUmScraper
+from src.clients.cached_client import CachedHttpClient
 from src.clients.httpx_client import AsyncHttpxClient
-from src.repositories.pandas_repository import PandasOfferRepository
+from src.repositories.file_repository import FileOfferRepository
 from src.services.coordinator import ScrapeCoordinator
 
 
@@ -72,6 +73,10 @@ def parse_args() -> argparse.Namespace:
         help="Request timeout in seconds (default: 20.0)",
     )
     parser.add_argument("--user-agent", help="Custom User-Agent string")
+    parser.add_argument(
+        "--cache-path",
+        help="SQLite file caching responses across runs (revalidated with conditional GETs)",
+    )
 
     return parser.parse_args()
 
@@ -86,11 +91,16 @@ async def main():
         timeout=args.timeout,
         rate_limit_seconds=args.rate_limit_seconds,
         user_agent=args.user_agent,
+        burst=args.max_concurrency,
     )
+    if args.cache_path:
+        http_client = CachedHttpClient(http_client, args.cache_path)
 
-    scraper = DoisPorUmScraper.default(async_http_client=http_client)
+    scraper = DoisPorUmScraper.default(
+        async_http_client=http_client, max_concurrency=args.max_concurrency
+    )
 
-    repository = PandasOfferRepository()
+    repository = FileOfferRepository()
     coordinator = ScrapeCoordinator(scraper=scraper, repository=repository)
 
     # Run the scraping process
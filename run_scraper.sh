@@ -8,5 +8,6 @@ uv run python scraper.py \
   --max-items 120 \
   --rate-limit-seconds 0.8 \
   --max-concurrency 6 \
+  --format csv \
   --csv-path doisporum_ofertas.csv \
   --jsonl-path doisporum_ofertas.jsonl
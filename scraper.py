@@ -5,7 +5,7 @@ Web scraper for doisporum.net offers following SOLID principles.
 Setup with uv:
     uv venv
     source .venv/bin/activate  # (Windows: .venv\\Scripts\\activate)
-    uv add "httpx[http2]==0.28.1" beautifulsoup4 lxml pandas tqdm
+    uv add aiohttp "httpx[http2]==0.28.1" beautifulsoup4 lxml pyarrow selectolax tqdm
 
 Usage:
     uv run python scraper.py --seed-url "https://doisporum.net/" --max-items 120
@@ -13,21 +13,42 @@ Usage:
 
 import argparse
 import asyncio
+import codecs
+import csv
 import json
 import logging
+import multiprocessing
+import os
 import re
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Protocol, Optional, List, Dict, Any
+from typing import Protocol, Optional, List, Dict, Any, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
+import aiohttp
 import httpx
-import pandas as pd
-from bs4 import BeautifulSoup
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from bs4 import BeautifulSoup, Tag
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from tqdm.asyncio import tqdm
 
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator; block scanning falls back to `re`
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator; serialization falls back to `json`
+    orjson = None
+
 # Constants
 BASE_URL = "https://doisporum.net"
 DETAIL_HREF_PATTERN = r"^/home/details/\d+/?$"
@@ -35,11 +56,191 @@ PHONE_PATTERN = r"\(?(\d{2})\)?\s?(\d{4,5})-(\d{4})"
 CEP_PATTERN = r"\b\d{5}-\d{3}\b"
 ADDRESS_INDICATORS = r"Rua|Av\.?|R\.|Al\.?|Largo|Praça|Praca|Rod\."
 OFFER_KEYWORDS = r"^oferta\b|2\s*por\s*1|dois\s*por\s*um|2x1"
+# Attribute-prefix selectors let the parser skip anchors that can never match
+DETAIL_LINK_SELECTOR = 'a[href^="/home/details/"]'
+WEBSITE_LINK_SELECTOR = 'a[href^="http"]:not([href*="doisporum.net"])'
+TEXT_BLOCK_TAGS = ("p", "li", "div", "span", "h3", "h4", "h5", "h6")
+DETAIL_SCAN_SELECTOR = ", ".join([*TEXT_BLOCK_TAGS, "img", WEBSITE_LINK_SELECTOR])
 PAGINATION_TEXTS = {"próximo", "proximo", "seguinte", "next", "mais"}
+JSONL_CHUNK_SIZE = 10_000  # Items encoded per write() call
+RETRY_STATUSES = {429, 500, 502, 503, 504}  # Transient; everything else fails fast
+OUTPUT_FORMATS = ("parquet", "feather", "csv")
+# forkserver keeps the event loop and HTTP client threads out of the parse
+# workers; platforms without it (Windows) only offer spawn
+PARSE_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+CSV_FIELDS = [
+    "id",
+    "url",
+    "title",
+    "offer",
+    "description",
+    "address",
+    "phone",
+    "website",
+    "images",
+    "images_json",
+]
+
+# Compiled once at import; the hot per-block loops call the bound methods
+_RE_DETAIL_HREF = re.compile(DETAIL_HREF_PATTERN)
+_RE_OFFER_PREFIX = re.compile(r"^oferta\b", re.IGNORECASE)
+_RE_OFFER_KW = re.compile(OFFER_KEYWORDS, re.IGNORECASE)
+_RE_CEP = re.compile(CEP_PATTERN)
+_RE_ADDR = re.compile(ADDRESS_INDICATORS, re.IGNORECASE)
+_RE_PHONE = re.compile(PHONE_PATTERN)
+_RE_DETAIL_ID = re.compile(r"/details/(\d+)")
+_RE_LOC_PREFIX = re.compile(r"^[A-Z\s]+:")
+
+# Patterns every detail-page text block is classified against; bit i <-> entry i
+_BLOCK_REGEXES = (_RE_OFFER_PREFIX, _RE_OFFER_KW, _RE_CEP, _RE_ADDR, _RE_PHONE)
+_BIT_OFFER_PREFIX, _BIT_OFFER_KW, _BIT_CEP, _BIT_ADDR, _BIT_PHONE = (
+    1 << i for i in range(len(_BLOCK_REGEXES))
+)
+_BIT_ADDRESS_LIKE = _BIT_CEP | _BIT_ADDR
+
+
+def _build_block_database():
+    """Compile the block patterns into one Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+
+    # Hyperscan rejects \b in Unicode (UCP) mode, so each pattern is compiled
+    # without it. That matches a superset, and _scan_block re-checks those
+    # hits with `re` to keep its Unicode semantics.
+    base_flags = (
+        hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[r.pattern.replace(r"\b", "").encode() for r in _BLOCK_REGEXES],
+        ids=list(range(len(_BLOCK_REGEXES))),
+        elements=len(_BLOCK_REGEXES),
+        flags=[
+            base_flags | (hyperscan.HS_FLAG_CASELESS if r.flags & re.IGNORECASE else 0)
+            for r in _BLOCK_REGEXES
+        ],
+    )
+    return database
+
+
+_BLOCK_DATABASE = _build_block_database()
+_BOUNDARY_CHECKS = [
+    (1 << i, regex) for i, regex in enumerate(_BLOCK_REGEXES) if r"\b" in regex.pattern
+]
+
+
+def _on_block_match(pattern_id, start, end, flags, context):
+    """Hyperscan match callback: record which pattern fired."""
+    context[0] |= 1 << pattern_id
+
+
+def _scan_block(block: str) -> int:
+    """Bitmask of the block patterns found in `block`.
+
+    The phone bit is only reported for address-like blocks (CEP or address
+    indicator), the only place it is consulted.
+    """
+    if _BLOCK_DATABASE is None:
+        bits = 0
+        if _RE_OFFER_PREFIX.match(block):
+            # OFFER_KEYWORDS includes the prefix, so a prefix hit is a keyword hit
+            bits |= _BIT_OFFER_PREFIX | _BIT_OFFER_KW
+        elif _RE_OFFER_KW.search(block):
+            bits |= _BIT_OFFER_KW
+        if _RE_CEP.search(block):
+            bits |= _BIT_CEP
+        if _RE_ADDR.search(block):
+            bits |= _BIT_ADDR
+        if bits & _BIT_ADDRESS_LIKE and _RE_PHONE.search(block):
+            bits |= _BIT_PHONE
+        return bits
+
+    found = [0]
+    _BLOCK_DATABASE.scan(
+        block.encode(), match_event_handler=_on_block_match, context=found
+    )
+    bits = found[0]
+    for bit, regex in _BOUNDARY_CHECKS:
+        if bits & bit and not regex.search(block):
+            bits &= ~bit
+    if not bits & _BIT_ADDRESS_LIKE:
+        bits &= ~_BIT_PHONE
+    return bits
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# HTML helpers: selectolax (Lexbor) by default, BeautifulSoup as fallback
+def offer_id_from_url(url: str) -> Optional[str]:
+    """Numeric id of a detail URL (`.../details/<id>/`), or None."""
+    # Detail URLs all end in /details/<id>; split before reaching for the regex
+    parts = url.rstrip("/").rsplit("/", 2)
+    if len(parts) == 3 and parts[1] == "details" and parts[2].isdigit():
+        return parts[2]
+    id_match = _RE_DETAIL_ID.search(url)
+    return id_match.group(1) if id_match else None
+
+
+HtmlTree = Union[LexborHTMLParser, BeautifulSoup]
+HtmlNode = Union[LexborNode, Tag]
+
+# BeautifulSoup's get_text() skips these; Lexbor would include their contents
+_NON_TEXT_TAGS = ["script", "style", "template"]
+
+
+def parse_html(html: Union[str, bytes], use_bs4: bool = False) -> HtmlTree:
+    """Build a parse tree with the selected backend."""
+    if use_bs4:
+        return BeautifulSoup(html, "lxml")
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(_NON_TEXT_TAGS)
+    return tree
+
+
+def select(tree: HtmlTree, selector: str) -> List[HtmlNode]:
+    """All nodes matching a CSS selector, in document order."""
+    if isinstance(tree, BeautifulSoup):
+        return tree.select(selector)
+    return tree.css(selector)
+
+
+def select_one(tree: HtmlTree, selector: str) -> Optional[HtmlNode]:
+    """First node matching a CSS selector."""
+    if isinstance(tree, BeautifulSoup):
+        return tree.select_one(selector)
+    return tree.css_first(selector)
+
+
+def node_attr(node: HtmlNode, name: str) -> Optional[str]:
+    """Attribute value of a node, or None."""
+    if isinstance(node, Tag):
+        return node.get(name)
+    return node.attributes.get(name)
+
+
+def node_tag(node: HtmlNode) -> str:
+    """Lower-case tag name of a node."""
+    if isinstance(node, Tag):
+        return node.name
+    return node.tag
+
+
+def node_text(node: HtmlNode) -> str:
+    """Stripped text of a node and its descendants."""
+    if isinstance(node, Tag):
+        return node.get_text(strip=True)
+    return node.text(strip=True)
 
 
 # Domain Entities
-@dataclass
+@dataclass(slots=True)
 class OfferItem:
     """Domain entity representing an offer item."""
 
@@ -51,11 +252,22 @@ class OfferItem:
     address: str = ""
     phone: str = ""
     website: str = ""
-    images: List[str] = None
-
-    def __post_init__(self):
-        if self.images is None:
-            self.images = []
+    images: List[str] = field(default_factory=list)
+    id_int: Optional[int] = None  # Numeric id for sorting; not serialized
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat record for serialization (cheaper than `asdict`, which deep-copies)."""
+        return {
+            "id": self.id,
+            "url": self.url,
+            "title": self.title,
+            "offer": self.offer,
+            "description": self.description,
+            "address": self.address,
+            "phone": self.phone,
+            "website": self.website,
+            "images": self.images,
+        }
 
 
 # Protocols (Dependency Inversion)
@@ -66,6 +278,10 @@ class HttpClient(Protocol):
         """Fetch HTML content from URL."""
         ...
 
+    async def aclose(self) -> None:
+        """Release network resources held by the client."""
+        ...
+
 
 class DetailParser(Protocol):
     """Protocol for parsing detail pages."""
@@ -78,12 +294,8 @@ class DetailParser(Protocol):
 class ListPageParser(Protocol):
     """Protocol for parsing list pages."""
 
-    def extract_detail_links(self, html: str) -> List[str]:
-        """Extract detail page links from list page."""
-        ...
-
-    def extract_pagination_links(self, html: str) -> List[str]:
-        """Extract pagination links from list page."""
+    def parse_list(self, html: str) -> Tuple[List[str], List[str]]:
+        """Extract (detail_links, pagination_links) from list page."""
         ...
 
 
@@ -98,8 +310,63 @@ class OfferRepository(Protocol):
         """Save offers to JSONL file."""
         ...
 
+    def save_parquet(self, items: List[OfferItem], path: str) -> None:
+        """Save offers to Parquet file."""
+        ...
+
+    def save_feather(self, items: List[OfferItem], path: str) -> None:
+        """Save offers to Feather file."""
+        ...
+
 
 # Implementations
+class HostRateLimiter:
+    """Per-host token bucket: bursts up to `burst` requests, then `rate` req/s."""
+
+    def __init__(self, rate_limit_seconds: float, burst: int = 1):
+        self.rate = 1.0 / rate_limit_seconds if rate_limit_seconds > 0 else 0.0
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, List[float]] = {}  # host -> [tokens, last_refill]
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a request to `host` is allowed."""
+        if not self.rate:
+            return
+
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(host, [float(self.burst), now])
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            if tokens < 1:
+                # Holding the lock keeps waiters for this host in FIFO order
+                await asyncio.sleep((1 - tokens) / self.rate)
+                tokens, now = 1.0, time.monotonic()
+            bucket[0], bucket[1] = tokens - 1, now
+
+
+def retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Seconds to wait before retrying, honoring a Retry-After header."""
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, retry_at.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return 2**attempt * 0.25  # Exponential backoff
+
+
+def to_utf8(body: bytes, encoding: Optional[str]) -> bytes:
+    """Body re-encoded as UTF-8 when the response declared another charset."""
+    if encoding is None or codecs.lookup(encoding).name == "utf-8":
+        return body
+    return body.decode(encoding, errors="replace").encode()
+
+
 class AsyncHttpxClient:
     """Async HTTP client implementation using httpx."""
 
@@ -108,6 +375,7 @@ class AsyncHttpxClient:
         timeout: float = 20.0,
         rate_limit_seconds: float = 0.8,
         user_agent: Optional[str] = None,
+        max_concurrency: int = 6,
     ):
         self.timeout = timeout
         self.rate_limit_seconds = rate_limit_seconds
@@ -115,126 +383,286 @@ class AsyncHttpxClient:
             user_agent
             or "Mozilla/5.0 (compatible; OfferScraper/1.0; +contact@example.com)"
         )
-        self._last_request_time = 0.0
+        self._rate_limiter = HostRateLimiter(rate_limit_seconds, burst=max_concurrency)
+        # Single pooled client: keeps TCP/TLS/HTTP2 sessions alive across requests.
+        # The transport retries failed connection attempts on its own.
+        transport = httpx.AsyncHTTPTransport(
+            retries=3,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        )
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": self.user_agent},
+        )
 
     async def get_text(self, url: str) -> Optional[str]:
         """Fetch HTML content from URL with retries and rate limiting."""
-        await self._apply_rate_limit()
+        response = await self.get(url)
+        return response.text if response is not None else None
+
+    async def get_bytes(self, url: str) -> Optional[bytes]:
+        """Fetch the body as UTF-8 bytes, the only encoding Lexbor assumes.
+
+        UTF-8 bodies (and bodies without a declared charset) are passed through
+        undecoded; any other charset from Content-Type is transcoded first.
+        """
+        response = await self.get(url)
+        if response is None:
+            return None
+        return to_utf8(response.content, response.encoding)
 
-        headers = {"User-Agent": self.user_agent}
+    async def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[httpx.Response]:
+        """GET with retries and rate limiting; None when the page can't be fetched.
+
+        A 304 reply to a conditional request is returned as-is (without a body).
+        """
+        host = urlparse(url).netloc
+
+        for attempt in range(3):  # Up to 3 retries
+            await self._rate_limiter.acquire(host)
+            try:
+                # Streamed: the status arrives before the body, so the body of an
+                # error or retry response is never downloaded
+                async with self._client.stream("GET", url, headers=headers) as response:
+                    if response.status_code == 304:  # Caller's copy is current
+                        return response
+                    if response.status_code not in RETRY_STATUSES or attempt == 2:
+                        response.raise_for_status()
+                        await response.aread()
+                        return response
+                # Retry once the stream is closed, so no connection is held while waiting
+                delay = retry_delay(response.headers.get("Retry-After"), attempt)
+                logging.warning(
+                    f"HTTP {response.status_code} on {url}, retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Already retried by the transport (retries=3)
+                logging.warning(f"Giving up on {url}: {e}")
+                return None
+            except httpx.TransportError as e:
+                # Read/write timeouts and protocol errors: transient, as for aiohttp
+                logging.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
+                if attempt < 2:  # Don't sleep after last attempt
+                    await asyncio.sleep(retry_delay(None, attempt))
+            except httpx.HTTPError as e:
+                logging.warning(f"Giving up on {url}: {e}")
+                return None
+
+        logging.error(f"Failed to fetch {url} after 3 attempts")
+        return None
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+
+class AiohttpClient:
+    """Async HTTP client implementation using aiohttp."""
+
+    def __init__(
+        self,
+        timeout: float = 20.0,
+        rate_limit_seconds: float = 0.8,
+        user_agent: Optional[str] = None,
+        max_concurrency: int = 6,
+    ):
+        self.timeout = timeout
+        self.rate_limit_seconds = rate_limit_seconds
+        self.max_concurrency = max_concurrency
+        self.user_agent = (
+            user_agent
+            or "Mozilla/5.0 (compatible; OfferScraper/1.0; +contact@example.com)"
+        )
+        self._rate_limiter = HostRateLimiter(rate_limit_seconds, burst=max_concurrency)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the shared session lazily, inside the running event loop."""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.max_concurrency,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": self.user_agent},
+            )
+        return self._session
+
+    async def get_text(self, url: str) -> Optional[str]:
+        """Fetch HTML content from URL with retries and rate limiting."""
+        host = urlparse(url).netloc
+        session = self._get_session()
 
         for attempt in range(3):  # Up to 3 retries
+            await self._rate_limiter.acquire(host)
             try:
-                async with httpx.AsyncClient(
-                    timeout=self.timeout, follow_redirects=True, http2=True
-                ) as client:
-                    response = await client.get(url, headers=headers)
-                    response.raise_for_status()
-                    return response.text
-
-            except Exception as e:
+                async with session.get(url) as response:
+                    if response.status not in RETRY_STATUSES or attempt == 2:
+                        response.raise_for_status()
+                        # Lenient like httpx: a mislabeled page must not abort the run
+                        return await response.text(errors="replace")
+                # Retry once the response is released, so no pooled connection
+                # is held while waiting
+                delay = retry_delay(response.headers.get("Retry-After"), attempt)
+                logging.warning(
+                    f"HTTP {response.status} on {url}, retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+            except aiohttp.ClientResponseError as e:
+                logging.warning(f"Giving up on {url}: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logging.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
                 if attempt < 2:  # Don't sleep after last attempt
-                    await asyncio.sleep(1 + attempt)  # Linear backoff
+                    await asyncio.sleep(retry_delay(None, attempt))
 
         logging.error(f"Failed to fetch {url} after 3 attempts")
         return None
 
-    async def _apply_rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
-        if elapsed < self.rate_limit_seconds:
-            await asyncio.sleep(self.rate_limit_seconds - elapsed)
-        self._last_request_time = time.time()
+    async def aclose(self):
+        """Close the underlying session and its connector."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
 
 class DoisPorUmListPageParser:
     """Parser for doisporum.net list pages."""
 
-    def extract_detail_links(self, html: str) -> List[str]:
-        """Extract detail page links matching the pattern."""
-        soup = BeautifulSoup(html, "lxml")
-        links = []
+    def __init__(self, use_bs4: bool = False):
+        self.use_bs4 = use_bs4
 
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if re.match(DETAIL_HREF_PATTERN, href):
-                absolute_url = urljoin(BASE_URL, href)
-                links.append(absolute_url)
+    def parse_list(self, html: str) -> Tuple[List[str], List[str]]:
+        """Detail and pagination links of a list page, from a single parse."""
+        tree = parse_html(html, self.use_bs4)
+        return self._detail_links(tree), self._pagination_links(tree)
 
-        return list(set(links))  # Deduplicate
+    def extract_detail_links(self, html: str) -> List[str]:
+        """Extract detail page links matching the pattern."""
+        return self._detail_links(parse_html(html, self.use_bs4))
 
     def extract_pagination_links(self, html: str) -> List[str]:
         """Extract pagination links using multiple heuristics."""
-        soup = BeautifulSoup(html, "lxml")
-        pagination_links = []
+        return self._pagination_links(parse_html(html, self.use_bs4))
+
+    def _detail_links(self, tree: HtmlTree) -> List[str]:
+        links = set()  # Deduplicate while walking
+
+        for link in select(tree, DETAIL_LINK_SELECTOR):
+            href = node_attr(link, "href")
+            if _RE_DETAIL_HREF.match(href):
+                links.add(urljoin(BASE_URL, href))
+
+        return list(links)
+
+    def _pagination_links(self, tree: HtmlTree) -> List[str]:
+        pagination_links = set()  # Deduplicate while walking
 
         # Strategy 1: a[rel="next"] and link[rel="next"]
-        for selector in ['a[rel="next"]', 'link[rel="next"]']:
-            for link in soup.select(selector):
-                href = link.get("href")
-                if href:
-                    pagination_links.append(urljoin(BASE_URL, href))
+        for link in select(tree, 'a[rel="next"], link[rel="next"]'):
+            href = node_attr(link, "href")
+            if href:
+                pagination_links.add(urljoin(BASE_URL, href))
 
         # Strategy 2: anchors with pagination text
-        for link in soup.find_all("a", href=True):
-            text = link.get_text(strip=True).lower()
+        for link in select(tree, "a[href]"):
+            text = node_text(link).lower()
             if any(keyword in text for keyword in PAGINATION_TEXTS):
-                href = link["href"]
-                pagination_links.append(urljoin(BASE_URL, href))
+                href = node_attr(link, "href")
+                pagination_links.add(urljoin(BASE_URL, href))
 
-        return list(set(pagination_links))  # Deduplicate
+        return list(pagination_links)
 
 
 class DoisPorUmDetailParser:
     """Parser for doisporum.net detail pages."""
 
-    def parse(self, html: str, url: str) -> Optional[OfferItem]:
+    def __init__(self, use_bs4: bool = False):
+        self.use_bs4 = use_bs4
+
+    def parse(self, html: Union[str, bytes], url: str) -> Optional[OfferItem]:
         """Parse detail page and extract offer information."""
-        soup = BeautifulSoup(html, "lxml")
+        return self.parse_tree(parse_html(html, self.use_bs4), url)
 
+    def parse_tree(self, tree: HtmlTree, url: str) -> Optional[OfferItem]:
+        """Extract offer information from an already parsed detail page."""
         # Extract ID from URL
-        id_match = re.search(r"/details/(\d+)", url)
-        offer_id = id_match.group(1) if id_match else None
+        offer_id = offer_id_from_url(url)
+        id_int = int(offer_id) if offer_id and offer_id.isdecimal() else None
 
-        # Extract all text blocks
-        blocks = self._extract_text_blocks(soup)
+        # Text blocks, website and images all come from one walk of the tree
+        blocks, website, images = self._scan_page(tree)
+        classes = self._classify_blocks(blocks)
 
         offer = OfferItem(
             id=offer_id,
+            id_int=id_int,
             url=url,
-            title=self._extract_title(soup),
-            offer=self._extract_offer(blocks),
-            description=self._extract_description(blocks),
-            address=self._extract_address(blocks),
-            phone=self._extract_phone(blocks, html),
-            website=self._extract_website(soup),
-            images=self._extract_images(soup),
+            title=self._extract_title(tree),
+            offer=self._extract_offer(classes),
+            description=self._extract_description(classes),
+            address=self._extract_address(classes),
+            phone=self._extract_phone(classes, " ".join(blocks)),
+            website=website,
+            images=images,
         )
 
         return offer
 
-    def _extract_text_blocks(self, soup: BeautifulSoup) -> List[str]:
-        """Extract and normalize text blocks from p, li, div elements."""
+    def _scan_page(self, tree: HtmlTree) -> Tuple[List[str], str, List[str]]:
+        """Collect text blocks, the first external website and image URLs.
+
+        A single combined selector visits the relevant nodes in document
+        order; each node is dispatched on its tag name.
+        """
         blocks = []
-        for tag in soup.find_all(["p", "li", "div"]):
-            text = tag.get_text(strip=True)
-            if text and len(text) > 10:  # Filter out very short texts
-                # Normalize whitespace
-                normalized = re.sub(r"\s+", " ", text)
-                blocks.append(normalized)
-
-        # Also get text from other elements that might contain useful info
-        for tag in soup.find_all(["span", "h3", "h4", "h5", "h6"]):
-            text = tag.get_text(strip=True)
-            if text and len(text) > 10:
-                normalized = re.sub(r"\s+", " ", text)
-                blocks.append(normalized)
-
-        return list(set(blocks))  # Remove duplicates
-
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+        seen = set()
+        website = ""
+        images = set()
+
+        for node in select(tree, DETAIL_SCAN_SELECTOR):
+            tag = node_tag(node)
+            if tag == "img":
+                image_url = self._image_url(node)
+                if image_url:
+                    images.add(urljoin(BASE_URL, image_url))
+            elif tag == "a":
+                if not website:
+                    href = node_attr(node, "href")
+                    if href.startswith(("http://", "https://")):
+                        website = href
+            else:
+                text = node_text(node)
+                if len(text) <= 10:  # Filter out very short texts
+                    continue
+                # Normalize whitespace; split() knows the same whitespace as \s,
+                # and node_text has already stripped both ends
+                normalized = " ".join(text.split())
+                if normalized not in seen:
+                    seen.add(normalized)
+                    blocks.append(normalized)
+
+        return blocks, website, list(images)
+
+    def _extract_text_blocks(self, tree: HtmlTree) -> List[str]:
+        """Extract normalized, de-duplicated text blocks in document order."""
+        return self._scan_page(tree)[0]
+
+    def _extract_title(self, tree: HtmlTree) -> str:
         """Extract title using priority order."""
         # Priority: h1 > h2 > [data-testid*="title"] > [class*="title"] > <title>
         selectors = [
@@ -246,74 +674,64 @@ class DoisPorUmDetailParser:
         ]
 
         for selector in selectors:
-            element = soup.select_one(selector)
+            element = select_one(tree, selector)
             if element:
-                return element.get_text(strip=True)
+                return node_text(element)
 
         return ""
 
-    def _extract_offer(self, blocks: List[str]) -> str:
-        """Extract offer text using pattern matching."""
-        offer_candidates = []
+    def _classify_blocks(self, blocks: List[str]) -> Dict[str, Any]:
+        """Run every block through the offer/address patterns in a single pass."""
+        shortest_prefix = shortest_kw = longest_clean = None
+        cep_blocks, indicator_blocks, phone_blocks = [], [], []
 
         for block in blocks:
-            # First priority: starts with "Oferta"
-            if re.match(r"^oferta\b", block, re.IGNORECASE):
-                offer_candidates.append(block)
+            bits = _scan_block(block)
 
-        if offer_candidates:
-            # Return shortest offer text (likely cleaner)
-            return min(offer_candidates, key=len)
-
-        # Second priority: contains offer keywords
-        for block in blocks:
-            if re.search(OFFER_KEYWORDS, block, re.IGNORECASE):
-                offer_candidates.append(block)
-
-        if offer_candidates:
-            return min(offer_candidates, key=len)
-
-        return ""
-
-    def _extract_description(self, blocks: List[str]) -> str:
-        """Extract description - first long block not starting with 'Oferta'."""
-        long_blocks = []
-
-        for block in blocks:
-            if (
-                len(block) > 120
-                and not re.match(r"^oferta\b", block, re.IGNORECASE)
-                and not re.search(OFFER_KEYWORDS, block, re.IGNORECASE)
+            # Strict comparisons keep the first block on ties, like min()/max()
+            if bits & _BIT_OFFER_PREFIX and (
+                shortest_prefix is None or len(block) < len(shortest_prefix)
             ):
-                long_blocks.append(block)
-
-        if long_blocks:
-            # Return the longest clean description
-            return max(long_blocks, key=len)
-
-        # Fallback: largest non-offer block
-        non_offer_blocks = []
-        for block in blocks:
-            if not re.match(r"^oferta\b", block, re.IGNORECASE) and not re.search(
-                OFFER_KEYWORDS, block, re.IGNORECASE
-            ):
-                non_offer_blocks.append(block)
-
-        if non_offer_blocks:
-            return max(non_offer_blocks, key=len)
+                shortest_prefix = block
+            if bits & _BIT_OFFER_KW:
+                if shortest_kw is None or len(block) < len(shortest_kw):
+                    shortest_kw = block
+            elif longest_clean is None or len(block) > len(longest_clean):
+                longest_clean = block
+
+            if bits & _BIT_CEP:
+                cep_blocks.append(block)
+            if bits & _BIT_ADDR:
+                indicator_blocks.append(block)
+            if bits & _BIT_PHONE:
+                phone_blocks.append(block)
+
+        return {
+            "offer_prefix": shortest_prefix or "",
+            "offer_kw": shortest_kw or "",
+            "description": longest_clean or "",
+            "cep": cep_blocks,
+            "addr_ind": indicator_blocks,
+            "phone": phone_blocks,
+        }
+
+    def _extract_offer(self, classes: Dict[str, Any]) -> str:
+        """Extract offer text using pattern matching."""
+        # First priority: starts with "Oferta"; then any offer keyword.
+        # Shortest candidate wins (likely cleaner).
+        return classes["offer_prefix"] or classes["offer_kw"]
 
-        return ""
+    def _extract_description(self, classes: Dict[str, Any]) -> str:
+        """Extract description - longest block without offer wording."""
+        return classes["description"]
 
-    def _extract_address(self, blocks: List[str]) -> str:
+    def _extract_address(self, classes: Dict[str, Any]) -> str:
         """Extract address - collect all addresses when multiple locations exist."""
 
         # First priority: blocks with CEP
-        cep_blocks = []
-        for block in blocks:
-            if re.search(CEP_PATTERN, block):
-                # Filter blocks that are clean individual addresses (not long mixed content)
-                if len(block) < 150:  # Relaxed limit to include shopping centers
-                    cep_blocks.append(block)
+        # Filter blocks that are clean individual addresses (not long mixed content)
+        # Relaxed limit to include shopping centers
+        cep_blocks = [block for block in classes["cep"] if len(block) < 150]
 
         # If we have multiple short CEP blocks, combine them
         if len(cep_blocks) > 1:
@@ -323,7 +741,7 @@ class DoisPorUmDetailParser:
 
             for addr in cep_blocks:
                 # Simple deduplication - check if core address is already included
-                core_addr = re.sub(r"^[A-Z\s]+:", "", addr)  # Remove location prefixes
+                core_addr = _RE_LOC_PREFIX.sub("", addr)  # Remove location prefixes
                 if core_addr not in seen_addresses:
                     unique_addresses.append(addr)
                     seen_addresses.add(core_addr)
@@ -334,12 +752,9 @@ class DoisPorUmDetailParser:
             return cep_blocks[0]
 
         # Fallback: look for address indicators
-        address_blocks = []
-        for block in blocks:
-            if (
-                re.search(ADDRESS_INDICATORS, block, re.IGNORECASE) and len(block) < 150
-            ):  # Consistent limit
-                address_blocks.append(block)
+        address_blocks = [
+            block for block in classes["addr_ind"] if len(block) < 150
+        ]  # Consistent limit
 
         if address_blocks:
             unique_addresses = list(set(address_blocks))
@@ -348,21 +763,13 @@ class DoisPorUmDetailParser:
 
         return ""
 
-    def _extract_phone(self, blocks: List[str], html: str) -> str:
+    def _extract_phone(self, classes: Dict[str, Any], text_all: str) -> str:
         """Extract phone - collect all phones when multiple locations exist."""
         phone_candidates = set()
 
         # First try to find phones in address-related blocks
-        address_blocks = []
-        for block in blocks:
-            if re.search(CEP_PATTERN, block) or re.search(
-                ADDRESS_INDICATORS, block, re.IGNORECASE
-            ):
-                address_blocks.append(block)
-
-        # Extract phones from address blocks
-        for block in address_blocks:
-            matches = re.findall(PHONE_PATTERN, block)
+        for block in classes["phone"]:
+            matches = _RE_PHONE.findall(block)
             for match in matches:
                 formatted_phone = f"({match[0]}) {match[1]}-{match[2]}"
                 phone_candidates.add(formatted_phone)
@@ -371,8 +778,8 @@ class DoisPorUmDetailParser:
         if phone_candidates:
             return " | ".join(sorted(phone_candidates))
 
-        # Fallback: search entire page for any phone
-        matches = re.findall(PHONE_PATTERN, html)
+        # Fallback: search the page's visible text for any phone
+        matches = _RE_PHONE.findall(text_all)
         for match in matches:
             formatted_phone = f"({match[0]}) {match[1]}-{match[2]}"
             phone_candidates.add(formatted_phone)
@@ -382,40 +789,34 @@ class DoisPorUmDetailParser:
 
         return ""
 
-    def _extract_website(self, soup: BeautifulSoup) -> str:
-        """Extract first external website link."""
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if href.startswith(("http://", "https://")) and "doisporum.net" not in href:
-                return href
-        return ""
-
-    def _extract_images(self, soup: BeautifulSoup) -> List[str]:
-        """Extract and normalize image URLs."""
-        images = set()
-
-        for img in soup.find_all("img"):
-            # Prefer srcset (last URL is typically highest quality)
-            srcset = img.get("srcset")
-            if srcset:
-                # Parse srcset and get the last (highest quality) URL
-                urls = [url.strip().split()[0] for url in srcset.split(",")]
-                if urls:
-                    image_url = urls[-1]
-                else:
-                    continue
-            else:
-                image_url = img.get("src")
-
-            if image_url:
-                absolute_url = urljoin(BASE_URL, image_url)
-                images.add(absolute_url)
-
-        return list(images)
-
-
-class PandasOfferRepository:
-    """Repository implementation using pandas for persistence."""
+    @staticmethod
+    def _image_url(img: HtmlNode) -> Optional[str]:
+        """Image URL of an <img>, preferring the last srcset candidate."""
+        # Prefer srcset (last URL is typically highest quality)
+        srcset = node_attr(img, "srcset")
+        if srcset:
+            # Parse srcset and get the last (highest quality) URL
+            urls = [url.strip().split()[0] for url in srcset.split(",")]
+            return urls[-1] if urls else None
+        return node_attr(img, "src")
+
+
+class FileOfferRepository:
+    """Repository implementation writing CSV, JSONL, Parquet and Feather files."""
+
+    SCHEMA = pa.schema(
+        [
+            ("id", pa.string()),
+            ("url", pa.string()),
+            ("title", pa.string()),
+            ("offer", pa.string()),
+            ("description", pa.string()),
+            ("address", pa.string()),
+            ("phone", pa.string()),
+            ("website", pa.string()),
+            ("images", pa.list_(pa.string())),
+        ]
+    )
 
     def save_csv(self, items: List[OfferItem], path: str) -> None:
         """Save offers to CSV file."""
@@ -423,16 +824,26 @@ class PandasOfferRepository:
             logging.warning("No items to save to CSV")
             return
 
-        data = []
-        for item in items:
-            item_dict = asdict(item)
-            # Add special columns for images
-            item_dict["images"] = ",".join(item.images) if item.images else ""
-            item_dict["images_json"] = json.dumps(item.images)
-            data.append(item_dict)
-
-        df = pd.DataFrame(data)
-        df.to_csv(path, index=False)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(CSV_FIELDS)
+            writer.writerows(
+                (
+                    item.id,
+                    item.url,
+                    item.title,
+                    item.offer,
+                    item.description,
+                    item.address,
+                    item.phone,
+                    item.website,
+                    # Special columns for images
+                    ",".join(item.images),
+                    dumps_json(item.images).decode("utf-8"),
+                )
+                for item in items
+            )
+
         logging.info(f"Saved {len(items)} items to {path}")
 
     def save_jsonl(self, items: List[OfferItem], path: str) -> None:
@@ -441,58 +852,102 @@ class PandasOfferRepository:
             logging.warning("No items to save to JSONL")
             return
 
-        with open(path, "w", encoding="utf-8") as f:
-            for item in items:
-                json.dump(asdict(item), f, ensure_ascii=False)
-                f.write("\n")
+        with open(path, "wb") as f:
+            # One write per chunk instead of two per item; chunking caps memory
+            for start in range(0, len(items), JSONL_CHUNK_SIZE):
+                chunk = items[start : start + JSONL_CHUNK_SIZE]
+                f.write(
+                    b"\n".join(dumps_json(item.to_dict()) for item in chunk) + b"\n"
+                )
 
         logging.info(f"Saved {len(items)} items to {path}")
 
+    def save_parquet(self, items: List[OfferItem], path: str) -> None:
+        """Save offers to Parquet file (zstd-compressed)."""
+        if not items:
+            logging.warning("No items to save to Parquet")
+            return
+
+        pq.write_table(self._to_table(items), path, compression="zstd")
+        logging.info(f"Saved {len(items)} items to {path}")
+
+    def save_feather(self, items: List[OfferItem], path: str) -> None:
+        """Save offers to Feather file (zstd-compressed)."""
+        if not items:
+            logging.warning("No items to save to Feather")
+            return
+
+        feather.write_feather(self._to_table(items), path, compression="zstd")
+        logging.info(f"Saved {len(items)} items to {path}")
+
+    def _to_table(self, items: List[OfferItem]) -> pa.Table:
+        """Build a columnar Arrow table from the offers."""
+        columns = {name: [] for name in self.SCHEMA.names}
+        for item in items:
+            for name, column in columns.items():
+                column.append(getattr(item, name))
+        return pa.table(columns, schema=self.SCHEMA)
+
 
 # Services / Use Cases
 class LinkCollector:
     """Service for collecting detail page links from list pages."""
 
-    def __init__(self, http_client: HttpClient, list_parser: ListPageParser):
+    def __init__(
+        self,
+        http_client: HttpClient,
+        list_parser: ListPageParser,
+        max_concurrency: int = 6,
+    ):
         self.http_client = http_client
         self.list_parser = list_parser
+        self.max_concurrency = max_concurrency
 
     async def collect_links(self, seed_url: str, max_items: int) -> List[str]:
-        """Collect detail links using BFS with pagination."""
+        """Collect detail links using BFS with pagination, one wave at a time."""
         collected_links = set()
         visited_pages = set()
-        pages_to_visit = [seed_url]
+        pages_to_visit = deque([seed_url])
 
         while pages_to_visit and len(collected_links) < max_items:
-            current_url = pages_to_visit.pop(0)
-
-            if current_url in visited_pages:
-                continue
-
-            visited_pages.add(current_url)
-            logging.info(f"Collecting links from: {current_url}")
-
-            html = await self.http_client.get_text(current_url)
-            if not html:
-                continue
+            # Next wave: up to max_concurrency unvisited pages, fetched together
+            batch = []
+            while pages_to_visit and len(batch) < self.max_concurrency:
+                page_url = pages_to_visit.popleft()
+                if page_url not in visited_pages:
+                    visited_pages.add(page_url)
+                    batch.append(page_url)
+            if not batch:
+                break  # Only already-visited pages were left in the frontier
+
+            logging.info(f"Collecting links from: {', '.join(batch)}")
+            htmls = await asyncio.gather(
+                *(self.http_client.get_text(page_url) for page_url in batch)
+            )
 
-            # Extract detail links
-            detail_links = self.list_parser.extract_detail_links(html)
-            for link in detail_links:
+            for html in htmls:
                 if len(collected_links) >= max_items:
-                    break
-                collected_links.add(link)
+                    break  # Quota filled by an earlier page of this wave
+                if not html:
+                    continue
 
-            logging.info(
-                f"Found {len(detail_links)} detail links. Total: {len(collected_links)}"
-            )
+                # One parse yields both detail and pagination links
+                detail_links, pagination_links = self.list_parser.parse_list(html)
+                for link in detail_links:
+                    if len(collected_links) >= max_items:
+                        break
+                    collected_links.add(link)
+
+                logging.info(
+                    f"Found {len(detail_links)} detail links. "
+                    f"Total: {len(collected_links)}"
+                )
 
-            # If we need more items, follow pagination
-            if len(collected_links) < max_items:
-                pagination_links = self.list_parser.extract_pagination_links(html)
-                for link in pagination_links:
-                    if link not in visited_pages:
-                        pages_to_visit.append(link)
+                # If we need more items, follow pagination
+                if len(collected_links) < max_items:
+                    for link in pagination_links:
+                        if link not in visited_pages:
+                            pages_to_visit.append(link)
 
         result = list(collected_links)[:max_items]
         logging.info(f"Collected {len(result)} detail links total")
@@ -500,20 +955,100 @@ class LinkCollector:
 
 
 class DetailScraper:
-    """Service for scraping detail pages with concurrency control."""
+    """Service for scraping detail pages: async fetchers feed a parser pool.
+
+    Fetching stays on the event loop; parsing is CPU-bound, so fetched pages
+    go through a queue to workers that run the parser in a process pool.
+    With ``parse_workers=0`` pages are parsed inline on the event loop.
+    """
 
     def __init__(
         self,
         http_client: HttpClient,
         detail_parser: DetailParser,
         max_concurrency: int = 6,
+        parse_workers: Optional[int] = None,
     ):
         self.http_client = http_client
         self.detail_parser = detail_parser
         self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_concurrency = max_concurrency
+        if parse_workers is None:
+            parse_workers = os.cpu_count() or 1
+        self.parse_workers = parse_workers
 
     async def scrape_details(self, urls: List[str]) -> List[OfferItem]:
         """Scrape detail pages with concurrency control."""
+        if not self.parse_workers:
+            return await self._scrape_inline(urls)
+
+        # Bounded so fetchers cannot run arbitrarily far ahead of the parsers
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.max_concurrency)
+        results: List[OfferItem] = []
+
+        with ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context(PARSE_START_METHOD),
+        ) as pool:
+            with tqdm(total=len(urls), desc="Scraping details") as progress:
+                parsers = [
+                    asyncio.create_task(
+                        self._parse_worker(queue, pool, results, progress)
+                    )
+                    for _ in range(self.parse_workers)
+                ]
+                feeder = asyncio.create_task(
+                    self._feed_details(urls, queue, progress, len(parsers))
+                )
+                tasks = [feeder, *parsers]
+                try:
+                    # Awaited together: a failed parse (or a broken pool) is
+                    # re-raised at once instead of leaving the fetchers blocked
+                    # on a queue nobody drains
+                    await asyncio.gather(*tasks)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+
+        return results
+
+    async def _feed_details(
+        self, urls: List[str], queue: asyncio.Queue, progress, workers: int
+    ) -> None:
+        """Fetch every page into the queue, then send one stop marker per worker."""
+        await asyncio.gather(
+            *(self._fetch_detail(url, queue, progress) for url in urls)
+        )
+        for _ in range(workers):
+            await queue.put(None)
+
+    async def _fetch_detail(self, url: str, queue: asyncio.Queue, progress) -> None:
+        """Fetch one detail page and hand it to the parser stage."""
+        async with self.semaphore:
+            html = await self.http_client.get_text(url)
+        if html:
+            await queue.put((html, url))
+        else:
+            progress.update(1)
+
+    async def _parse_worker(
+        self,
+        queue: asyncio.Queue,
+        pool: ProcessPoolExecutor,
+        results: List[OfferItem],
+        progress,
+    ) -> None:
+        """Parse queued pages in the process pool until a stop marker arrives."""
+        loop = asyncio.get_running_loop()
+        while (job := await queue.get()) is not None:
+            html, url = job
+            item = await loop.run_in_executor(pool, self.detail_parser.parse, html, url)
+            if item:
+                results.append(item)
+            progress.update(1)
+
+    async def _scrape_inline(self, urls: List[str]) -> List[OfferItem]:
+        """Fetch and parse every page on the event loop."""
         tasks = [self._scrape_single_detail(url) for url in urls]
 
         results = []
@@ -541,13 +1076,37 @@ class ScrapeCoordinator:
         link_collector: LinkCollector,
         detail_scraper: DetailScraper,
         repository: OfferRepository,
+        http_client: Optional[HttpClient] = None,
     ):
         self.link_collector = link_collector
         self.detail_scraper = detail_scraper
         self.repository = repository
+        self.http_client = http_client
 
-    async def run(self, seed_url: str, max_items: int, csv_path: str, jsonl_path: str):
+    async def run(
+        self,
+        seed_url: str,
+        max_items: int,
+        output_path: str,
+        jsonl_path: str,
+        output_format: str = "parquet",
+    ):
         """Run the complete scraping process."""
+        try:
+            await self._run(seed_url, max_items, output_path, jsonl_path, output_format)
+        finally:
+            if self.http_client is not None:
+                await self.http_client.aclose()
+
+    async def _run(
+        self,
+        seed_url: str,
+        max_items: int,
+        output_path: str,
+        jsonl_path: str,
+        output_format: str,
+    ):
+        """Collect, scrape, sort and persist offers."""
         logging.info("Starting scrape process...")
 
         # Collect detail links
@@ -565,21 +1124,20 @@ class ScrapeCoordinator:
             return
 
         # Sort by numeric ID if possible
-        def sort_key(offer):
-            try:
-                return int(offer.id) if offer.id else float("inf")
-            except (ValueError, TypeError):
-                return float("inf")
-
-        offers.sort(key=sort_key)
+        offers.sort(key=lambda o: o.id_int if o.id_int is not None else float("inf"))
 
         # Save results
-        self.repository.save_csv(offers, csv_path)
+        savers = {
+            "parquet": self.repository.save_parquet,
+            "feather": self.repository.save_feather,
+            "csv": self.repository.save_csv,
+        }
+        savers[output_format](offers, output_path)
         self.repository.save_jsonl(offers, jsonl_path)
 
         logging.info(f"Scraping completed! {len(offers)} offers saved.")
         print(f"\n🎉 Success! Scraped {len(offers)} offers")
-        print(f"📄 CSV saved to: {csv_path}")
+        print(f"📄 {output_format.upper()} saved to: {output_path}")
         print(f"📝 JSONL saved to: {jsonl_path}")
 
 
@@ -617,11 +1175,33 @@ def parse_args() -> argparse.Namespace:
         default=6,
         help="Maximum concurrent requests (default: 6)",
     )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="Processes parsing detail pages; 0 parses inline (default: CPU count)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="parquet",
+        help="Tabular output format (default: parquet)",
+    )
     parser.add_argument(
         "--csv-path",
         default="doisporum_ofertas.csv",
         help="Path for CSV output (default: doisporum_ofertas.csv)",
     )
+    parser.add_argument(
+        "--parquet-path",
+        default="doisporum_ofertas.parquet",
+        help="Path for Parquet output (default: doisporum_ofertas.parquet)",
+    )
+    parser.add_argument(
+        "--feather-path",
+        default="doisporum_ofertas.feather",
+        help="Path for Feather output (default: doisporum_ofertas.feather)",
+    )
     parser.add_argument(
         "--jsonl-path",
         default="doisporum_ofertas.jsonl",
@@ -634,6 +1214,17 @@ def parse_args() -> argparse.Namespace:
         help="Request timeout in seconds (default: 20.0)",
     )
     parser.add_argument("--user-agent", help="Custom User-Agent string")
+    parser.add_argument(
+        "--use-bs4",
+        action="store_true",
+        help="Parse pages with BeautifulSoup instead of selectolax (fallback)",
+    )
+    parser.add_argument(
+        "--http-client",
+        choices=["aiohttp", "httpx"],
+        default="aiohttp",
+        help="HTTP client implementation (default: aiohttp)",
+    )
 
     return parser.parse_args()
 
@@ -644,27 +1235,34 @@ async def main():
     args = parse_args()
 
     # Dependency injection / composition
-    http_client = AsyncHttpxClient(
+    client_cls = AiohttpClient if args.http_client == "aiohttp" else AsyncHttpxClient
+    http_client = client_cls(
         timeout=args.timeout,
         rate_limit_seconds=args.rate_limit_seconds,
         user_agent=args.user_agent,
+        max_concurrency=args.max_concurrency,
     )
 
-    list_parser = DoisPorUmListPageParser()
-    detail_parser = DoisPorUmDetailParser()
-    repository = PandasOfferRepository()
+    list_parser = DoisPorUmListPageParser(use_bs4=args.use_bs4)
+    detail_parser = DoisPorUmDetailParser(use_bs4=args.use_bs4)
+    repository = FileOfferRepository()
 
-    link_collector = LinkCollector(http_client, list_parser)
-    detail_scraper = DetailScraper(http_client, detail_parser, args.max_concurrency)
+    link_collector = LinkCollector(http_client, list_parser, args.max_concurrency)
+    detail_scraper = DetailScraper(
+        http_client, detail_parser, args.max_concurrency, args.parse_workers
+    )
 
-    coordinator = ScrapeCoordinator(link_collector, detail_scraper, repository)
+    coordinator = ScrapeCoordinator(
+        link_collector, detail_scraper, repository, http_client=http_client
+    )
 
     # Run the scraping process
     await coordinator.run(
         seed_url=args.seed_url,
         max_items=args.max_items,
-        csv_path=args.csv_path,
+        output_path=getattr(args, f"{args.format}_path"),
         jsonl_path=args.jsonl_path,
+        output_format=args.format,
     )
 
 
@@ -1,148 +1,156 @@
 """Parser for doisporum.net detail pages."""
 
-import re
-from typing import List, Optional
-from urllib.parse import urljoin
+from typing import List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.html import HtmlElement
 
 from poc.src.config import (
-    BASE_URL,
-    PHONE_PATTERN,
-    CEP_PATTERN,
-    ADDRESS_INDICATORS,
-    OFFER_KEYWORDS,
+    DETAIL_ID_RE,
+    PHONE_RE,
+    PHONE_BYTES_RE,
+    LOCATION_PREFIX_RE,
+    WS_RE,
 )
 from poc.src.models.offer import OfferItem
+from poc.src.parsers.block_classifier import (
+    ADDRESS,
+    CEP,
+    OFFER_KEYWORD,
+    OFFER_START,
+    PHONE,
+    classify_blocks,
+)
+from poc.src.parsers.html_tree import parse_html, text_of
+from poc.src.parsers.urls import absolutize
+
+# Tags whose text becomes a candidate block, collected in one tree walk
+TEXT_BLOCK_TAGS = ("p", "li", "div", "span", "h3", "h4", "h5", "h6")
+
+# Title sources by priority: h1 > h2 > [data-testid*="title" i] > [class*="title" i] > <title>
+TITLE_TESTID, TITLE_CLASS = 2, 3
+TITLE_TAG_PRIORITY = {"h1": 0, "h2": 1, "title": 4}
 
 
 class DoisPorUmDetailParser:
     """Parser for doisporum.net detail pages."""
 
-    def parse(self, html: str, url: str) -> Optional[OfferItem]:
+    def parse(self, html: bytes, url: str) -> Optional[OfferItem]:
         """Parse detail page and extract offer information."""
-        soup = BeautifulSoup(html, "lxml")
+        root = parse_html(html)
 
         # Extract ID from URL
-        id_match = re.search(r"/details/(\d+)", url)
+        id_match = DETAIL_ID_RE.search(url)
         offer_id = id_match.group(1) if id_match else None
 
-        # Extract all text blocks
-        blocks = self._extract_text_blocks(soup)
+        # Title, text blocks, website and images in one walk over the tree
+        title, blocks, website, images = self._scan_tree(root)
+        masks = classify_blocks(blocks)
+        offer_text, description, address = self._pick_blocks(blocks, masks)
 
         offer = OfferItem(
             id=offer_id,
             url=url,
-            title=self._extract_title(soup),
-            offer=self._extract_offer(blocks),
-            description=self._extract_description(blocks),
-            address=self._extract_address(blocks),
-            phone=self._extract_phone(blocks, html),
-            website=self._extract_website(soup),
-            images=self._extract_images(soup),
+            title=title,
+            offer=offer_text,
+            description=description,
+            address=address,
+            phone=self._extract_phone(blocks, masks, html),
+            website=website,
+            images=images,
         )
 
         return offer
 
-    def _extract_text_blocks(self, soup: BeautifulSoup) -> List[str]:
-        """Extract and normalize text blocks from p, li, div elements."""
+    def _scan_tree(self, root: HtmlElement) -> Tuple[str, List[str], str, List[str]]:
+        """Collect title, text blocks, website and images in a single document-order pass."""
+        title_elements = [None] * 5
         blocks = []
-        for tag in soup.find_all(["p", "li", "div"]):
-            text = tag.get_text(strip=True)
-            if text and len(text) > 10:  # Filter out very short texts
-                # Normalize whitespace
-                normalized = re.sub(r"\s+", " ", text)
-                blocks.append(normalized)
-
-        # Also get text from other elements that might contain useful info
-        for tag in soup.find_all(["span", "h3", "h4", "h5", "h6"]):
-            text = tag.get_text(strip=True)
-            if text and len(text) > 10:
-                normalized = re.sub(r"\s+", " ", text)
-                blocks.append(normalized)
-
-        return list(set(blocks))  # Remove duplicates
-
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract title using priority order."""
-        # Priority: h1 > h2 > [data-testid*="title"] > [class*="title"] > <title>
-        selectors = [
-            "h1",
-            "h2",
-            '[data-testid*="title" i]',
-            '[class*="title" i]',
-            "title",
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.get_text(strip=True)
-
-        return ""
-
-    def _extract_offer(self, blocks: List[str]) -> str:
-        """Extract offer text using pattern matching."""
-        offer_candidates = []
-
-        for block in blocks:
-            # First priority: starts with "Oferta"
-            if re.match(r"^oferta\b", block, re.IGNORECASE):
-                offer_candidates.append(block)
-
-        if offer_candidates:
-            # Return shortest offer text (likely cleaner)
-            return min(offer_candidates, key=len)
-
-        # Second priority: contains offer keywords
-        for block in blocks:
-            if re.search(OFFER_KEYWORDS, block, re.IGNORECASE):
-                offer_candidates.append(block)
-
-        if offer_candidates:
-            return min(offer_candidates, key=len)
-
-        return ""
-
-    def _extract_description(self, blocks: List[str]) -> str:
-        """Extract description - first long block not starting with 'Oferta'."""
-        long_blocks = []
-
-        for block in blocks:
-            if (
-                    len(block) > 120
-                    and not re.match(r"^oferta\b", block, re.IGNORECASE)
-                    and not re.search(OFFER_KEYWORDS, block, re.IGNORECASE)
-            ):
-                long_blocks.append(block)
-
-        if long_blocks:
-            # Return the longest clean description
-            return max(long_blocks, key=len)
-
-        # Fallback: largest non-offer block
-        non_offer_blocks = []
-        for block in blocks:
-            if not re.match(r"^oferta\b", block, re.IGNORECASE) and not re.search(
-                    OFFER_KEYWORDS, block, re.IGNORECASE
-            ):
-                non_offer_blocks.append(block)
-
-        if non_offer_blocks:
-            return max(non_offer_blocks, key=len)
+        seen = set()
+        website = ""
+        images = []
+
+        for element in root.iter(etree.Element):
+            tag = element.tag
+
+            if tag in TEXT_BLOCK_TAGS:
+                text = text_of(element)
+                if len(text) > 10:  # Filter out very short texts
+                    normalized = WS_RE.sub(" ", text)  # Normalize whitespace
+                    if normalized not in seen:
+                        seen.add(normalized)
+                        blocks.append(normalized)
+            elif tag == "a":
+                if not website:
+                    href = element.get("href") or ""
+                    # First external link is the partner's website
+                    if href.startswith(("http://", "https://")) and "doisporum.net" not in href:
+                        website = href
+            elif tag == "img":
+                image_url = self._image_url(element)
+                if image_url:
+                    images.append(absolutize(image_url))
+            elif tag in TITLE_TAG_PRIORITY:
+                priority = TITLE_TAG_PRIORITY[tag]
+                if title_elements[priority] is None:
+                    title_elements[priority] = element
+
+            if title_elements[TITLE_TESTID] is None and "title" in (element.get("data-testid") or "").lower():
+                title_elements[TITLE_TESTID] = element
+            if title_elements[TITLE_CLASS] is None and "title" in (element.get("class") or "").lower():
+                title_elements[TITLE_CLASS] = element
+
+        title = next((text_of(e) for e in title_elements if e is not None), "")
+        images = list(dict.fromkeys(images))  # Deduplicate, keeping document order
+        return title, blocks, website, images
+
+    @staticmethod
+    def _image_url(img: HtmlElement) -> Optional[str]:
+        """Image URL of an <img>, preferring the last (highest quality) srcset entry."""
+        srcset = img.get("srcset")
+        if srcset:
+            urls = [url.strip().split()[0] for url in srcset.split(",")]
+            return urls[-1] if urls else None
+        return img.get("src")
+
+    def _pick_blocks(self, blocks: List[str], masks: List[int]) -> Tuple[str, str, str]:
+        """Offer, description and address, chosen in one pass over the classified blocks.
+
+        Offer: shortest block starting with "Oferta", else shortest block with an
+        offer keyword. Description: longest non-offer block over 120 chars, else
+        longest non-offer block. Ties keep the earliest block.
+        """
+        offer_start = offer_keyword = long_block = non_offer_block = ""
+        cep_blocks = []
+        address_blocks = []
 
-        return ""
+        for block, bits in zip(blocks, masks):
+            size = len(block)
+            if bits & OFFER_START and (not offer_start or size < len(offer_start)):
+                offer_start = block
+            if bits & OFFER_KEYWORD:
+                if not offer_keyword or size < len(offer_keyword):
+                    offer_keyword = block
+            elif not bits & OFFER_START:
+                if size > len(non_offer_block):
+                    non_offer_block = block
+                if size > 120 and size > len(long_block):
+                    long_block = block
+            # Short blocks only: clean individual addresses, not long mixed content
+            if size < 150:  # Relaxed limit to include shopping centers
+                if bits & CEP:
+                    cep_blocks.append(block)
+                if bits & ADDRESS:
+                    address_blocks.append(block)
 
-    def _extract_address(self, blocks: List[str]) -> str:
-        """Extract address - collect all addresses when multiple locations exist."""
+        return (
+            offer_start or offer_keyword,
+            long_block or non_offer_block,
+            self._format_address(cep_blocks, address_blocks),
+        )
 
-        # First priority: blocks with CEP
-        cep_blocks = []
-        for block in blocks:
-            if re.search(CEP_PATTERN, block):
-                # Filter blocks that are clean individual addresses (not long mixed content)
-                if len(block) < 150:  # Relaxed limit to include shopping centers
-                    cep_blocks.append(block)
+    def _format_address(self, cep_blocks: List[str], address_blocks: List[str]) -> str:
+        """Join the address blocks - collect all addresses when multiple locations exist."""
 
         # If we have multiple short CEP blocks, combine them
         if len(cep_blocks) > 1:
@@ -152,7 +160,7 @@ class DoisPorUmDetailParser:
 
             for addr in cep_blocks:
                 # Simple deduplication - check if core address is already included
-                core_addr = re.sub(r"^[A-Z\s]+:", "", addr)  # Remove location prefixes
+                core_addr = LOCATION_PREFIX_RE.sub("", addr)  # Remove location prefixes
                 if core_addr not in seen_addresses:
                     unique_addresses.append(addr)
                     seen_addresses.add(core_addr)
@@ -162,37 +170,23 @@ class DoisPorUmDetailParser:
         elif len(cep_blocks) == 1:
             return cep_blocks[0]
 
-        # Fallback: look for address indicators
-        address_blocks = []
-        for block in blocks:
-            if (
-                    re.search(ADDRESS_INDICATORS, block, re.IGNORECASE) and len(block) < 150
-            ):  # Consistent limit
-                address_blocks.append(block)
-
+        # Fallback: blocks with address indicators
         if address_blocks:
-            unique_addresses = list(set(address_blocks))
+            unique_addresses = list(dict.fromkeys(address_blocks))
             unique_addresses.sort(key=len)
             return " | ".join(unique_addresses[:3])
 
         return ""
 
-    def _extract_phone(self, blocks: List[str], html: str) -> str:
+    def _extract_phone(self, blocks: List[str], masks: List[int], html: bytes) -> str:
         """Extract phone - collect all phones when multiple locations exist."""
         phone_candidates = set()
 
-        # First try to find phones in address-related blocks
-        address_blocks = []
-        for block in blocks:
-            if re.search(CEP_PATTERN, block) or re.search(
-                    ADDRESS_INDICATORS, block, re.IGNORECASE
-            ):
-                address_blocks.append(block)
-
-        # Extract phones from address blocks
-        for block in address_blocks:
-            matches = re.findall(PHONE_PATTERN, block)
-            for match in matches:
+        # First try to find phones in address-related blocks (PHONE is only set on those)
+        for block, bits in zip(blocks, masks):
+            if not bits & PHONE:
+                continue
+            for match in PHONE_RE.findall(block):
                 formatted_phone = f"({match[0]}) {match[1]}-{match[2]}"
                 phone_candidates.add(formatted_phone)
 
@@ -200,44 +194,13 @@ class DoisPorUmDetailParser:
         if phone_candidates:
             return " | ".join(sorted(phone_candidates))
 
-        # Fallback: search entire page for any phone
-        matches = re.findall(PHONE_PATTERN, html)
+        # Fallback: search entire page for any phone (digits only, so ASCII decoding is safe)
+        matches = PHONE_BYTES_RE.findall(html)
         for match in matches:
-            formatted_phone = f"({match[0]}) {match[1]}-{match[2]}"
+            formatted_phone = (b"(%s) %s-%s" % match).decode()
             phone_candidates.add(formatted_phone)
 
         if phone_candidates:
             return " | ".join(sorted(phone_candidates))
 
         return ""
-
-    def _extract_website(self, soup: BeautifulSoup) -> str:
-        """Extract first external website link."""
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if href.startswith(("http://", "https://")) and "doisporum.net" not in href:
-                return href
-        return ""
-
-    def _extract_images(self, soup: BeautifulSoup) -> List[str]:
-        """Extract and normalize image URLs."""
-        images = set()
-
-        for img in soup.find_all("img"):
-            # Prefer srcset (last URL is typically highest quality)
-            srcset = img.get("srcset")
-            if srcset:
-                # Parse srcset and get the last (highest quality) URL
-                urls = [url.strip().split()[0] for url in srcset.split(",")]
-                if urls:
-                    image_url = urls[-1]
-                else:
-                    continue
-            else:
-                image_url = img.get("src")
-
-            if image_url:
-                absolute_url = urljoin(BASE_URL, image_url)
-                images.add(absolute_url)
-
-        return list(images)
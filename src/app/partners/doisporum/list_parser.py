@@ -1,47 +1,62 @@
 """Parser for doisporum.net list pages."""
 
-import re
-from typing import List
-from urllib.parse import urljoin
+from typing import List, Tuple
 
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.html import HtmlElement
 
-from poc.src.config import BASE_URL, DETAIL_HREF_PATTERN, PAGINATION_TEXTS
+from poc.src.config import DETAIL_HREF_RE, PAGINATION_TEXTS
+from poc.src.parsers.html_tree import parse_html, text_of
+from poc.src.parsers.urls import absolutize
+
+# Compiled once; evaluated by libxml2 without building Python objects per node
+NEXT_LINKS_XPATH = etree.XPath('//a[@rel="next"]/@href | //link[@rel="next"]/@href')
 
 
 class DoisPorUmListPageParser:
     """Parser for doisporum.net list pages."""
 
-    def extract_detail_links(self, html: str) -> List[str]:
+    def parse_list(self, html: bytes) -> Tuple[List[str], List[str]]:
+        """Detail and pagination links of a list page, from a single parse."""
+        root = parse_html(html)
+        return self._detail_links(root), self._pagination_links(root)
+
+    def extract_detail_links(self, html: bytes) -> List[str]:
         """Extract detail page links matching the pattern."""
-        soup = BeautifulSoup(html, "lxml")
+        return self._detail_links(parse_html(html))
+
+    def extract_pagination_links(self, html: bytes) -> List[str]:
+        """Extract pagination links using multiple heuristics."""
+        return self._pagination_links(parse_html(html))
+
+    def _detail_links(self, root: HtmlElement) -> List[str]:
+        """Detail page links matching the pattern."""
         links = []
 
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if re.match(DETAIL_HREF_PATTERN, href):
-                absolute_url = urljoin(BASE_URL, href)
+        for link in root.iter("a"):
+            href = link.get("href")
+            if href is not None and DETAIL_HREF_RE.match(href):
+                absolute_url = absolutize(href)
                 links.append(absolute_url)
 
-        return list(set(links))  # Deduplicate
+        return list(dict.fromkeys(links))  # Deduplicate, keeping document order
 
-    def extract_pagination_links(self, html: str) -> List[str]:
-        """Extract pagination links using multiple heuristics."""
-        soup = BeautifulSoup(html, "lxml")
+    def _pagination_links(self, root: HtmlElement) -> List[str]:
+        """Pagination links using multiple heuristics."""
         pagination_links = []
 
         # Strategy 1: a[rel="next"] and link[rel="next"]
-        for selector in ['a[rel="next"]', 'link[rel="next"]']:
-            for link in soup.select(selector):
-                href = link.get("href")
-                if href:
-                    pagination_links.append(urljoin(BASE_URL, href))
+        for href in NEXT_LINKS_XPATH(root):
+            if href:
+                pagination_links.append(absolutize(href))
 
         # Strategy 2: anchors with pagination text
-        for link in soup.find_all("a", href=True):
-            text = link.get_text(strip=True).lower()
+        for link in root.iter("a"):
+            href = link.get("href")
+            if href is None:
+                continue
+            text = text_of(link).lower()
             if any(keyword in text for keyword in PAGINATION_TEXTS):
-                href = link["href"]
-                pagination_links.append(urljoin(BASE_URL, href))
+                pagination_links.append(absolutize(href))
 
-        return list(set(pagination_links))  # Deduplicate
+        return list(dict.fromkeys(pagination_links))  # Deduplicate, keeping document order
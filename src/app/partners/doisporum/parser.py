@@ -1,4 +1,7 @@
-from typing import List
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterator, List, Optional
 
 from poc.src.app.partners.doisporum.detail_parser import DoisPorUmDetailParser
 from poc.src.app.partners.doisporum.list_parser import DoisPorUmListPageParser
@@ -8,35 +11,58 @@ from poc.src.protocols.base import HttpClient
 from poc.src.services.detail_scraper import DetailScraper
 from poc.src.services.link_collector import LinkCollector
 
+# forkserver keeps the event loop and the client's threads out of the parse
+# workers; platforms without it (Windows) only offer spawn
+PARSE_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
 
 class DoisPorUmScraper(PageScrapper):
 
     def __init__(self, async_http_client: HttpClient,
                  list_parser: ListPageParser,
-                 detail_parser: DetailParser):
+                 detail_parser: DetailParser,
+                 executor: Optional[Executor] = None,
+                 max_concurrency: int = 3):
         self.async_http_client = async_http_client
         self.list_parser = list_parser
         self.detail_parser = detail_parser
+        # Shared by both services for parsing; owned (and shut down) by the scraper
+        self.executor = executor
+        # Built once: every call shares the same semaphore and parser caches
+        self._link_collector = LinkCollector(http_client=async_http_client,
+                                             list_parser=list_parser,
+                                             max_concurrency=max_concurrency,
+                                             executor=executor)
+        self._detail_scraper = DetailScraper(http_client=async_http_client,
+                                             detail_parser=detail_parser,
+                                             max_concurrency=max_concurrency,
+                                             executor=executor)
 
     @staticmethod
-    def default(async_http_client: HttpClient) -> 'DoisPorUmScraper':
+    def default(async_http_client: HttpClient, max_concurrency: int = 3) -> 'DoisPorUmScraper':
         return DoisPorUmScraper(
             async_http_client=async_http_client,
             list_parser=DoisPorUmListPageParser(),
-            detail_parser=DoisPorUmDetailParser()
+            detail_parser=DoisPorUmDetailParser(),
+            max_concurrency=max_concurrency,
+            executor=ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                         mp_context=multiprocessing.get_context(PARSE_START_METHOD))
         )
 
     async def collect_detail_urls(self, seed_url: str, max_items: int) -> List[str]:
-        link_collector = LinkCollector(http_client=self.async_http_client, list_parser=self.list_parser)
-        return await link_collector.collect_links(seed_url=seed_url, max_items=max_items)
+        return await self._link_collector.collect_links(seed_url=seed_url, max_items=max_items)
+
+    async def fetch_offers(self, detail_urls: List[str]) -> List[OfferItem]:
+        return await self._detail_scraper.scrape_details(urls=detail_urls)
 
-    async def fetch_offers(self, detail_urls: List[str], max_concurrency: int = 3) -> List[OfferItem]:
-        detail_scraper = DetailScraper(http_client=self.async_http_client,
-                                       detail_parser=self.detail_parser,
-                                       max_concurrency=max_concurrency
-                                       )
+    async def stream_offers(self, detail_urls: List[str]) -> AsyncIterator[OfferItem]:
+        async for offer in self._detail_scraper.stream_details(urls=detail_urls):
+            yield offer
 
-        return await detail_scraper.scrape_details(urls=detail_urls)
+    async def aclose(self) -> None:
+        await self.async_http_client.aclose()
+        if self.executor is not None:
+            self.executor.shutdown()
 
     # def extract_detail_links(self, html: str) -> List[str]:
     #     return self.list_parser.extract_detail_links(html=html)
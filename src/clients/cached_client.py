@@ -0,0 +1,100 @@
+"""HTTP client decorator caching responses on disk across runs."""
+
+import gzip
+import logging
+import sqlite3
+import time
+from typing import Optional, Tuple
+
+from src.clients.httpx_client import AsyncHttpxClient, to_utf8
+
+
+class CachedHttpClient:
+    """Wraps AsyncHttpxClient with a sqlite response cache and conditional GETs.
+
+    Bodies are stored gzip-compressed, keyed by the full URL (query included).
+    A cached URL is revalidated with If-None-Match / If-Modified-Since; on a
+    304 the stored body is returned, on a 200 the entry is replaced.
+    """
+
+    def __init__(self, client: AsyncHttpxClient, path: str):
+        self.client = client
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body_gzip BLOB NOT NULL,
+                fetched_at REAL NOT NULL,
+                encoding TEXT
+            )
+            """
+        )
+        # Caches written before the encoding column existed: their rows read as UTF-8
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(responses)")}
+        if "encoding" not in columns:
+            self._db.execute("ALTER TABLE responses ADD COLUMN encoding TEXT")
+        self._db.commit()
+
+    async def get_text(self, url: str) -> Optional[str]:
+        """Fetch HTML content, revalidating a cached copy when there is one."""
+        fetched = await self._fetch(url)
+        if fetched is None:
+            return None
+        body, encoding = fetched
+        return body.decode(encoding or "utf-8", errors="replace")
+
+    async def get_bytes(self, url: str) -> Optional[bytes]:
+        """Fetch the body as UTF-8 bytes, revalidating a cached copy when there is one."""
+        fetched = await self._fetch(url)
+        return to_utf8(*fetched) if fetched is not None else None
+
+    async def _fetch(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Raw body and its declared encoding, from the cache or the network."""
+        cached = self._db.execute(
+            "SELECT etag, last_modified, body_gzip, encoding FROM responses WHERE url = ?",
+            (url,),
+        ).fetchone()
+
+        headers = {}
+        if cached:
+            etag, last_modified, _, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = await self.client.get(url, headers=headers)
+        if response is None:
+            return None
+
+        if response.status_code == 304:
+            if not cached:  # Nothing was asked to be revalidated
+                return None
+            logging.debug(f"Not modified, using cached copy of {url}")
+            return gzip.decompress(cached[2]), cached[3]
+
+        body = response.content
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses"
+            " (url, etag, last_modified, body_gzip, fetched_at, encoding)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                url,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                gzip.compress(body),
+                time.time(),
+                response.encoding,
+            ),
+        )
+        self._db.commit()
+        return body, response.encoding
+
+    async def aclose(self) -> None:
+        """Close the wrapped client and the cache database."""
+        await self.client.aclose()
+        self._db.close()
@@ -1,12 +1,22 @@
 """HTTP client implementation using httpx."""
 
 import asyncio
+import codecs
 import logging
-import time
-from typing import Optional
+from typing import Dict, Optional
+from urllib.parse import urlparse
 
 import httpx
 
+from src.clients.rate_limiter import HostRateLimiter
+
+
+def to_utf8(body: bytes, encoding: Optional[str]) -> bytes:
+    """Body re-encoded as UTF-8 when the response declared another charset."""
+    if encoding is None or codecs.lookup(encoding).name == "utf-8":
+        return body
+    return body.decode(encoding, errors="replace").encode()
+
 
 class AsyncHttpxClient:
     """Async HTTP client implementation using httpx."""
@@ -16,6 +26,7 @@ class AsyncHttpxClient:
         timeout: float = 20.0,
         rate_limit_seconds: float = 0.8,
         user_agent: Optional[str] = None,
+        burst: int = 1,
     ):
         self.timeout = timeout
         self.rate_limit_seconds = rate_limit_seconds
@@ -23,22 +34,49 @@ class AsyncHttpxClient:
             user_agent
             or "Mozilla/5.0 (compatible; OfferScraper/1.0; +contact@example.com)"
         )
-        self._last_request_time = 0.0
+        # Separate budget per host: different hosts never wait on each other
+        self._rate_limiter = HostRateLimiter(rate_limit_seconds, burst=burst)
+        # One pooled client for every request: TCP/TLS/HTTP2 sessions are reused
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            http2=True,
+            headers={"User-Agent": self.user_agent},
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+
+    async def __aenter__(self) -> "AsyncHttpxClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def get_text(self, url: str) -> Optional[str]:
         """Fetch HTML content from URL with retries and rate limiting."""
-        await self._apply_rate_limit()
+        response = await self.get(url)
+        return response.text if response is not None else None
+
+    async def get_bytes(self, url: str) -> Optional[bytes]:
+        """Fetch the body as UTF-8 bytes; parsers decode it while building the tree.
+
+        UTF-8 bodies (and bodies without a declared charset) are passed through
+        undecoded; any other charset from Content-Type is transcoded first.
+        """
+        response = await self.get(url)
+        return to_utf8(response.content, response.encoding) if response is not None else None
 
-        headers = {"User-Agent": self.user_agent}
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[httpx.Response]:
+        """GET with retries and rate limiting; a 304 reply is returned as-is."""
+        host = urlparse(url).netloc
 
         for attempt in range(3):  # Up to 3 retries
+            await self._rate_limiter.acquire(host)
             try:
-                async with httpx.AsyncClient(
-                    timeout=self.timeout, follow_redirects=True, http2=True
-                ) as client:
-                    response = await client.get(url, headers=headers)
-                    response.raise_for_status()
-                    return response.text
+                response = await self._client.get(url, headers=headers)
+                if response.status_code == 304:  # Conditional GET: caller's copy is current
+                    return response
+                response.raise_for_status()
+                return response
 
             except Exception as e:
                 logging.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
@@ -48,10 +86,6 @@ class AsyncHttpxClient:
         logging.error(f"Failed to fetch {url} after 3 attempts")
         return None
 
-    async def _apply_rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
-        if elapsed < self.rate_limit_seconds:
-            await asyncio.sleep(self.rate_limit_seconds - elapsed)
-        self._last_request_time = time.time()
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._client.aclose()
@@ -0,0 +1,31 @@
+"""Per-host rate limiting for HTTP clients."""
+
+import asyncio
+import time
+from typing import Dict, List
+
+
+class HostRateLimiter:
+    """Per-host token bucket: bursts up to `burst` requests, then `rate` req/s."""
+
+    def __init__(self, rate_limit_seconds: float, burst: int = 1):
+        self.rate = 1.0 / rate_limit_seconds if rate_limit_seconds > 0 else 0.0
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, List[float]] = {}  # host -> [tokens, last_refill]
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a request to `host` is allowed."""
+        if not self.rate:
+            return
+
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(host, [float(self.burst), now])
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            if tokens < 1:
+                # Holding the lock keeps waiters for this host in FIFO order
+                await asyncio.sleep((1 - tokens) / self.rate)
+                tokens, now = 1.0, time.monotonic()
+            bucket[0], bucket[1] = tokens - 1, now
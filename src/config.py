@@ -1,7 +1,10 @@
 """Configuration constants for the scraper."""
 
+import re
+
 # Base URL and patterns
 BASE_URL = "https://doisporum.net"
+BASE_ORIGIN = "https://doisporum.net"  # scheme://host, prepended to root-relative links
 DETAIL_HREF_PATTERN = r"^/home/details/\d+/?$"
 
 # Extraction patterns
@@ -12,3 +15,18 @@ OFFER_KEYWORDS = r"^oferta\b|2\s*por\s*1|dois\s*por\s*um|2x1"
 
 # Pagination keywords
 PAGINATION_TEXTS = {"próximo", "proximo", "seguinte", "next", "mais"}
+
+# Cap on list pages queued for the BFS, so a misbehaving paginator cannot balloon it
+MAX_FRONTIER = 1000
+
+# Compiled once at import; parsers call the bound methods in their hot loops
+DETAIL_HREF_RE = re.compile(DETAIL_HREF_PATTERN)
+DETAIL_ID_RE = re.compile(r"/details/(\d+)")
+PHONE_RE = re.compile(PHONE_PATTERN)
+PHONE_BYTES_RE = re.compile(PHONE_PATTERN.encode())  # Page-wide fallback over the raw body
+CEP_RE = re.compile(CEP_PATTERN)
+ADDRESS_INDICATORS_RE = re.compile(ADDRESS_INDICATORS, re.IGNORECASE)
+OFFER_KEYWORDS_RE = re.compile(OFFER_KEYWORDS, re.IGNORECASE)
+OFFER_STARTS_RE = re.compile(r"^oferta\b", re.IGNORECASE)
+LOCATION_PREFIX_RE = re.compile(r"^[A-Z\s]+:")
+WS_RE = re.compile(r"\s+")
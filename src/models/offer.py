@@ -1,10 +1,10 @@
 """Domain entities for the scraper."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class OfferItem:
     """Domain entity representing an offer item."""
 
@@ -16,8 +16,4 @@ class OfferItem:
     address: str = ""
     phone: str = ""
     website: str = ""
-    images: List[str] = None
-
-    def __post_init__(self):
-        if self.images is None:
-            self.images = []
+    images: List[str] = field(default_factory=list)
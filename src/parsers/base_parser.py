@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Protocol, Optional, List
+from typing import AsyncIterator, Protocol, Optional, List, Tuple
 
 from poc.src.models.offer import OfferItem
 
@@ -11,14 +11,22 @@ class PageScrapper(ABC):
         ...
 
     @abstractmethod
-    async def fetch_offers(self, detail_urls: List[str], max_concurrency: int = 3) -> List[OfferItem]:
+    async def fetch_offers(self, detail_urls: List[str]) -> List[OfferItem]:
+        ...
+
+    @abstractmethod
+    def stream_offers(self, detail_urls: List[str]) -> AsyncIterator[OfferItem]:
+        ...
+
+    @abstractmethod
+    async def aclose(self) -> None:
         ...
 
 
 class DetailParser(Protocol):
     """Protocol for parsing detail pages."""
 
-    def parse(self, html: str, url: str) -> Optional[OfferItem]:
+    def parse(self, html: bytes, url: str) -> Optional[OfferItem]:
         """Parse HTML content and extract offer details."""
         ...
 
@@ -26,10 +34,14 @@ class DetailParser(Protocol):
 class ListPageParser(Protocol):
     """Protocol for parsing list pages."""
 
-    def extract_detail_links(self, html: str) -> List[str]:
+    def extract_detail_links(self, html: bytes) -> List[str]:
         """Extract detail page links from list page."""
         ...
 
-    def extract_pagination_links(self, html: str) -> List[str]:
+    def extract_pagination_links(self, html: bytes) -> List[str]:
         """Extract pagination links from list page."""
         ...
+
+    def parse_list(self, html: bytes) -> Tuple[List[str], List[str]]:
+        """Extract (detail_links, pagination_links) from list page."""
+        ...
@@ -0,0 +1,120 @@
+"""Page-wide classification of detail-page text blocks.
+
+Every block of a page is tagged in one scan with a bitmask of the patterns it
+contains, so the detail extractors only test bits instead of re-running each
+regex over every block.
+"""
+
+import re
+from bisect import bisect_right
+from typing import List
+
+from poc.src.config import (
+    ADDRESS_INDICATORS_RE,
+    CEP_RE,
+    OFFER_KEYWORDS_RE,
+    OFFER_STARTS_RE,
+    PHONE_RE,
+)
+
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator; classification falls back to `re`
+    hyperscan = None
+
+# Bit order follows BLOCK_REGEXES
+BLOCK_REGEXES = (OFFER_STARTS_RE, OFFER_KEYWORDS_RE, CEP_RE, ADDRESS_INDICATORS_RE, PHONE_RE)
+OFFER_START, OFFER_KEYWORD, CEP, ADDRESS, PHONE = (1 << i for i in range(len(BLOCK_REGEXES)))
+ADDRESS_LIKE = CEP | ADDRESS
+
+# Literals every match of a pattern contains: cheap substring tests that let the
+# `re` fallback skip the regex engine for most blocks
+OFFER_PREFIX = "oferta"
+OFFER_KEYWORD_LITERALS = ("por", "2x1")  # "2 por 1" / "dois por um" allow any spacing
+DIGIT_PATTERN_LITERAL = "-"  # CEP and phone numbers are both hyphenated
+
+# Blocks are whitespace-normalized, so a newline never occurs inside one and
+# multiline ^ anchors exactly at block starts
+SEPARATOR = "\n"
+
+
+def _build_database():
+    """Compile BLOCK_REGEXES into one Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+
+    # Hyperscan rejects \b in Unicode (UCP) mode, so each pattern is compiled
+    # without it. That matches a superset, and classify_blocks re-checks those
+    # hits with `re` to keep its Unicode semantics.
+    base_flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_MULTILINE
+    database = hyperscan.Database()
+    database.compile(
+            expressions=[r.pattern.replace(r"\b", "").encode() for r in BLOCK_REGEXES],
+            ids=list(range(len(BLOCK_REGEXES))),
+            elements=len(BLOCK_REGEXES),
+            flags=[
+                base_flags | (hyperscan.HS_FLAG_CASELESS if r.flags & re.IGNORECASE else 0)
+                for r in BLOCK_REGEXES
+            ],
+    )
+    return database
+
+
+_DATABASE = _build_database()
+# A hit is only a candidate when the pattern lost its \b or can cross a
+# separator (the \s in "2 por 1"); these bits are confirmed on the block itself
+_CONFIRM = [(OFFER_START, OFFER_STARTS_RE), (OFFER_KEYWORD, OFFER_KEYWORDS_RE), (CEP, CEP_RE)]
+
+
+def _on_match(pattern_id, start, end, flags, context):
+    """Hyperscan match callback: flag the block the match ends in."""
+    starts, masks = context
+    masks[bisect_right(starts, end - 1) - 1] |= 1 << pattern_id
+
+
+def classify_blocks(blocks: List[str]) -> List[int]:
+    """Bitmask of the BLOCK_REGEXES found in each block, in block order."""
+    if _DATABASE is None:
+        masks = []
+        for block in blocks:
+            bits = 0
+            folded = block.casefold()
+            if folded.startswith(OFFER_PREFIX) and OFFER_STARTS_RE.match(block):
+                # OFFER_KEYWORDS includes the prefix, so a prefix hit is a keyword hit
+                bits |= OFFER_START | OFFER_KEYWORD
+            elif any(k in folded for k in OFFER_KEYWORD_LITERALS) and OFFER_KEYWORDS_RE.search(block):
+                bits |= OFFER_KEYWORD
+            hyphenated = DIGIT_PATTERN_LITERAL in block
+            if hyphenated and CEP_RE.search(block):
+                bits |= CEP
+            if ADDRESS_INDICATORS_RE.search(block):
+                bits |= ADDRESS
+            if hyphenated and bits & ADDRESS_LIKE and PHONE_RE.search(block):
+                bits |= PHONE
+            masks.append(bits)
+        return masks
+
+    encoded = [block.encode() for block in blocks]
+    starts = []
+    position = 0
+    for block in encoded:
+        starts.append(position)
+        position += len(block) + len(SEPARATOR)
+
+    masks = [0] * len(blocks)
+    _DATABASE.scan(
+            SEPARATOR.encode().join(encoded), match_event_handler=_on_match, context=(starts, masks)
+    )
+    for index, bits in enumerate(masks):
+        if not bits:
+            continue
+        block = blocks[index]
+        for bit, regex in _CONFIRM:
+            if bits & bit and not regex.search(block):
+                bits &= ~bit
+        # Phones are only looked up in address-like blocks; a phone match can
+        # also start in the previous block, hence the re-check
+        if bits & PHONE and not (bits & ADDRESS_LIKE and PHONE_RE.search(block)):
+            bits &= ~PHONE
+        masks[index] = bits
+    return masks
@@ -0,0 +1,31 @@
+"""Helpers for parsing pages with lxml.html."""
+
+from typing import Union
+
+from lxml import etree, html
+
+# Their contents are never visible text (BeautifulSoup's get_text skips them too)
+NON_TEXT_TAGS = ("script", "style", "template")
+
+# Raw bodies are decoded by libxml2 itself. The clients hand over UTF-8 (they
+# transcode bodies served in another charset), so say so explicitly: libxml2
+# would otherwise guess Latin-1 for pages without a <meta charset>
+UTF8_PARSER = html.HTMLParser(encoding="utf-8")
+
+# Stands in for blank or comment-only bodies, which lxml refuses to parse
+EMPTY_DOCUMENT = b"<html><head></head><body></body></html>"
+
+
+def parse_html(markup: Union[bytes, str]) -> html.HtmlElement:
+    """Parse a page into an lxml tree without script/style/template elements."""
+    try:
+        root = html.document_fromstring(markup, parser=UTF8_PARSER)
+    except etree.ParserError:  # "Document is empty": parse as a page with no content
+        return html.document_fromstring(EMPTY_DOCUMENT, parser=UTF8_PARSER)
+    etree.strip_elements(root, *NON_TEXT_TAGS, with_tail=False)
+    return root
+
+
+def text_of(element: html.HtmlElement) -> str:
+    """Concatenated, individually stripped text nodes (like get_text(strip=True))."""
+    return "".join(text.strip() for text in element.itertext())
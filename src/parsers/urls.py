@@ -0,0 +1,28 @@
+"""URL helpers shared by the page parsers."""
+
+import re
+from urllib.parse import urljoin
+
+from poc.src.config import BASE_ORIGIN
+
+# Shapes urljoin rewrites even in absolute/root-relative links: stripped tabs
+# and newlines, empty params, empty query or fragment
+_NEEDS_URLJOIN_RE = re.compile(r"[;\t\r\n]|\?#|[?#]$")
+
+
+def absolutize(href: str) -> str:
+    """Absolute form of `href` relative to the site, same result as urljoin.
+
+    The common shapes (absolute http(s) URLs and root-relative paths) are
+    answered with a prefix check or a concatenation; anything urljoin would
+    resolve or rewrite (missing host, dot segments, //host, the shapes above)
+    goes through urljoin itself.
+    """
+    if _NEEDS_URLJOIN_RE.search(href):
+        return urljoin(BASE_ORIGIN, href)
+    if href.startswith(("http://", "https://")):
+        if href.partition("//")[2][:1] not in ("", "/", "?", "#"):
+            return href
+    elif href.startswith("/") and not href.startswith("//") and "/." not in href:
+        return BASE_ORIGIN + href
+    return urljoin(BASE_ORIGIN, href)
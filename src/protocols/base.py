@@ -1,6 +1,6 @@
 """Protocol definitions for dependency inversion."""
 
-from typing import Protocol, Optional, List
+from typing import IO, Protocol, Optional, List
 
 from src.models.offer import OfferItem
 
@@ -12,6 +12,14 @@ class HttpClient(Protocol):
         """Fetch HTML content from URL."""
         ...
 
+    async def get_bytes(self, url: str) -> Optional[bytes]:
+        """Fetch the raw HTML body from URL."""
+        ...
+
+    async def aclose(self) -> None:
+        """Release network resources held by the client."""
+        ...
+
 
 class OfferRepository(Protocol):
     """Protocol for persisting offers."""
@@ -23,3 +31,7 @@ class OfferRepository(Protocol):
     def save_jsonl(self, items: List[OfferItem], path: str) -> None:
         """Save offers to JSONL file."""
         ...
+
+    def append_jsonl(self, item: OfferItem, file: IO[str]) -> None:
+        """Write one offer as a JSONL line to an open text file."""
+        ...
@@ -0,0 +1,50 @@
+"""Repository implementation writing CSV and JSONL files."""
+
+import csv
+import json
+import logging
+from dataclasses import asdict, fields
+from typing import IO, List
+
+from src.models.offer import OfferItem
+
+CSV_FIELDS = [f.name for f in fields(OfferItem)] + ["images_json"]
+
+
+class FileOfferRepository:
+    """Repository implementation writing CSV and JSONL files."""
+
+    def save_csv(self, items: List[OfferItem], path: str) -> None:
+        """Save offers to CSV file."""
+        if not items:
+            logging.warning("No items to save to CSV")
+            return
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, lineterminator="\n")
+            writer.writeheader()
+            for item in items:
+                row = {name: getattr(item, name) for name in CSV_FIELDS[:-1]}
+                # Add special columns for images
+                row["images"] = ",".join(item.images)
+                row["images_json"] = json.dumps(item.images)
+                writer.writerow(row)
+
+        logging.info(f"Saved {len(items)} items to {path}")
+
+    def save_jsonl(self, items: List[OfferItem], path: str) -> None:
+        """Save offers to JSONL file."""
+        if not items:
+            logging.warning("No items to save to JSONL")
+            return
+
+        with open(path, "w", encoding="utf-8") as f:
+            for item in items:
+                self.append_jsonl(item, f)
+
+        logging.info(f"Saved {len(items)} items to {path}")
+
+    def append_jsonl(self, item: OfferItem, file: IO[str]) -> None:
+        """Write one offer as a JSONL line to an open text file."""
+        json.dump(asdict(item), file, ensure_ascii=False)
+        file.write("\n")
@@ -18,6 +18,13 @@ class ScrapeCoordinator:
         self.repository = repository
 
     async def run(self, seed_url: str, max_items: int, csv_path: str, jsonl_path: str):
+        """Run the complete scraping process, releasing the scraper's resources at the end."""
+        try:
+            await self._run(seed_url, max_items, csv_path, jsonl_path)
+        finally:
+            await self.scraper.aclose()
+
+    async def _run(self, seed_url: str, max_items: int, csv_path: str, jsonl_path: str):
         """Run the complete scraping process."""
         logging.info("Starting scrape process...")
 
@@ -28,8 +35,12 @@ class ScrapeCoordinator:
             logging.error("No detail URLs collected")
             return
 
-        # Scrape detail pages
-        offers = await self.scraper.fetch_offers(detail_urls)
+        # Scrape detail pages, writing each offer to JSONL as it arrives
+        offers = []
+        with open(jsonl_path, "w", encoding="utf-8") as jsonl_file:
+            async for offer in self.scraper.stream_offers(detail_urls):
+                self.repository.append_jsonl(offer, jsonl_file)
+                offers.append(offer)  # The CSV is written sorted, once all rows are in
 
         if not offers:
             logging.error("No offers scraped")
@@ -46,7 +57,7 @@ class ScrapeCoordinator:
 
         # Save results
         self.repository.save_csv(offers, csv_path)
-        self.repository.save_jsonl(offers, jsonl_path)
+        logging.info(f"Saved {len(offers)} items to {jsonl_path}")
 
         logging.info(f"Scraping completed! {len(offers)} offers saved.")
         print(f"\n🎉 Success! Scraped {len(offers)} offers")
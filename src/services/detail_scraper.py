@@ -1,7 +1,8 @@
 """Service for scraping detail pages with concurrency control."""
 
 import asyncio
-from typing import List, Optional
+from concurrent.futures import Executor
+from typing import AsyncIterator, List, Optional
 
 from tqdm.asyncio import tqdm
 
@@ -18,27 +19,38 @@ class DetailScraper:
             http_client: HttpClient,
             detail_parser: DetailParser,
             max_concurrency: int = 6,
+            executor: Optional[Executor] = None,
     ):
         self.http_client = http_client
         self.detail_parser = detail_parser
         self.semaphore = asyncio.Semaphore(max_concurrency)
+        # Parsing is CPU-bound: with an executor it runs off the event loop
+        self.executor = executor
 
     async def scrape_details(self, urls: List[str]) -> List[OfferItem]:
         """Scrape detail pages with concurrency control."""
-        tasks = [self._scrape_single_detail(url) for url in urls]
+        return [item async for item in self.stream_details(urls)]
 
-        results = []
-        for coro in tqdm.as_completed(tasks, desc="Scraping details"):
-            item = await coro
-            if item:
-                results.append(item)
+    async def stream_details(self, urls: List[str]) -> AsyncIterator[OfferItem]:
+        """Yield each parsed offer as soon as its page is done (completion order)."""
+        tasks = [self._scrape_single_detail(url) for url in urls]
 
-        return results
+        with tqdm(total=len(tasks), desc="Scraping details") as progress:
+            for coro in asyncio.as_completed(tasks):
+                item = await coro
+                progress.update(1)
+                if item:
+                    yield item
 
     async def _scrape_single_detail(self, url: str) -> Optional[OfferItem]:
         """Scrape a single detail page."""
         async with self.semaphore:
-            html = await self.http_client.get_text(url)
-            if html:
-                return self.detail_parser.parse(html, url)
-        return None
+            html = await self.http_client.get_bytes(url)
+        if not html:
+            return None
+        if self.executor is None:
+            return self.detail_parser.parse(html, url)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.detail_parser.parse, html, url
+        )
@@ -1,8 +1,12 @@
 """Service for collecting detail page links from list pages."""
 
+import asyncio
 import logging
-from typing import List
+from collections import deque
+from concurrent.futures import Executor
+from typing import List, Optional, Tuple
 
+from poc.src.config import MAX_FRONTIER
 from poc.src.parsers.base_parser import ListPageParser
 from poc.src.protocols.base import HttpClient
 
@@ -10,47 +14,70 @@ from poc.src.protocols.base import HttpClient
 class LinkCollector:
     """Service for collecting detail page links from list pages."""
 
-    def __init__(self, http_client: HttpClient, list_parser: ListPageParser):
+    def __init__(
+            self,
+            http_client: HttpClient,
+            list_parser: ListPageParser,
+            max_concurrency: int = 6,
+            executor: Optional[Executor] = None,
+    ):
         self.http_client = http_client
         self.list_parser = list_parser
+        self.max_concurrency = max_concurrency
+        self.executor = executor
 
     async def collect_links(self, seed_url: str, max_items: int) -> List[str]:
-        """Collect detail links using BFS with pagination."""
+        """Collect detail links using BFS with pagination, one wave at a time."""
         collected_links = set()
         visited_pages = set()
-        pages_to_visit = [seed_url]
+        pages_to_visit = deque([seed_url])
 
         while pages_to_visit and len(collected_links) < max_items:
-            current_url = pages_to_visit.pop(0)
+            # Next wave: up to max_concurrency unvisited pages, fetched together
+            batch = []
+            while pages_to_visit and len(batch) < self.max_concurrency:
+                page_url = pages_to_visit.popleft()
+                if page_url not in visited_pages:
+                    visited_pages.add(page_url)
+                    batch.append(page_url)
 
-            if current_url in visited_pages:
-                continue
+            logging.info(f"Collecting links from: {', '.join(batch)}")
+            htmls = await asyncio.gather(
+                *(self.http_client.get_bytes(page_url) for page_url in batch)
+            )
 
-            visited_pages.add(current_url)
-            logging.info(f"Collecting links from: {current_url}")
+            # Parse the whole wave at once (in parallel when there is an executor)
+            parsed = await asyncio.gather(
+                *(self._extract_links(html) for html in htmls if html)
+            )
 
-            html = await self.http_client.get_text(current_url)
-            if not html:
-                continue
+            for detail_links, pagination_links in parsed:
+                for link in detail_links:
+                    if len(collected_links) >= max_items:
+                        break
+                    collected_links.add(link)
 
-            # Extract detail links
-            detail_links = self.list_parser.extract_detail_links(html)
-            for link in detail_links:
-                if len(collected_links) >= max_items:
-                    break
-                collected_links.add(link)
+                logging.info(
+                    f"Found {len(detail_links)} detail links. Total: {len(collected_links)}"
+                )
 
-            logging.info(
-                f"Found {len(detail_links)} detail links. Total: {len(collected_links)}"
-            )
+                if len(collected_links) >= max_items:
+                    break  # Quota filled: this page's pagination is not needed
 
-            # If we need more items, follow pagination
-            if len(collected_links) < max_items:
-                pagination_links = self.list_parser.extract_pagination_links(html)
+                # We need more items: follow pagination, within the frontier cap
                 for link in pagination_links:
+                    if len(pages_to_visit) >= MAX_FRONTIER:
+                        break
                     if link not in visited_pages:
                         pages_to_visit.append(link)
 
-        result = list(collected_links)[:max_items]
+        result = list(collected_links)[:max_items]  # Guard only: the loop stops at the quota
         logging.info(f"Collected {len(result)} detail links total")
         return result
+
+    async def _extract_links(self, html: bytes) -> Tuple[List[str], List[str]]:
+        """Parse one list page, in the executor when one is configured."""
+        if self.executor is None:
+            return self.list_parser.parse_list(html)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.list_parser.parse_list, html)
@@ -11,7 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from src.clients.httpx_client import AsyncHttpxClient
 from poc.src.app.partners.doisporum.list_parser import DoisPorUmListPageParser
 from poc.src.app.partners.doisporum.detail_parser import DoisPorUmDetailParser
-from src.repositories.pandas_repository import PandasOfferRepository
+from src.repositories.file_repository import FileOfferRepository
 from src.services.link_collector import LinkCollector
 from src.services.detail_scraper import DetailScraper
 from src.services.coordinator import ScrapeCoordinator
@@ -25,7 +25,7 @@ async def test_modular_scraper():
     http_client = AsyncHttpxClient(rate_limit_seconds=0.5)
     list_parser = DoisPorUmListPageParser()
     detail_parser = DoisPorUmDetailParser()
-    repository = PandasOfferRepository()
+    repository = FileOfferRepository()
 
     link_collector = LinkCollector(http_client, list_parser)
     detail_scraper = DetailScraper(http_client, detail_parser, max_concurrency=3)
@@ -42,5 +42,13 @@ async def test_modular_scraper():
     print("✅ Modular scraper test completed!")
 
 
+def test_empty_body_parses_to_empty_results():
+    """Blank or comment-only 200 responses yield empty results instead of raising."""
+    for body in (b"", b"   ", b"<!-- x -->"):
+        assert DoisPorUmListPageParser().parse_list(body) == ([], [])
+        offer = DoisPorUmDetailParser().parse(body, "https://doisporum.net/home/details/1")
+        assert offer is not None and (offer.title, offer.address, offer.images) == ("", "", [])
+
+
 if __name__ == "__main__":
     asyncio.run(test_modular_scraper())
@@ -3,70 +3,201 @@
 Test script to debug the World Wine page extraction.
 """
 
+import argparse
 import asyncio
 import httpx
-from bs4 import BeautifulSoup
+import shelve
 import sys
 import os
+from typing import Any, Dict, List, Optional
+
+try:
+    import uvloop
+except ImportError:  # Optional; the default asyncio event loop is used instead
+    uvloop = None
 
 # Add the current directory to path to import from scraper.py
 sys.path.append(os.path.dirname(__file__))
-from scraper import DoisPorUmDetailParser, AsyncHttpxClient
-
-
-async def test_world_wine_page():
-    """Test the extraction for the World Wine page specifically."""
-    url = "https://doisporum.net/home/details/177"
-
-    # Create HTTP client and parser
-    client = AsyncHttpxClient(rate_limit_seconds=0.5)
+from scraper import (
+    _BIT_ADDRESS_LIKE,
+    AiohttpClient,
+    AsyncHttpxClient,
+    DoisPorUmDetailParser,
+    _scan_block,
+    parse_html,
+    to_utf8,
+)
+
+# Shared by every fetch in the process: one pooled HTTP/2 connection, kept alive
+# between requests; closed by main()
+_CLIENT = AsyncHttpxClient(rate_limit_seconds=0.5)
+
+
+WORLD_WINE_URL = "https://doisporum.net/home/details/177"
+
+# Bodies fetched by earlier runs, keyed by URL, with their ETag
+CACHE_PATH = ".http_cache"
+
+
+async def fetch_cached(
+    url: str, client: AsyncHttpxClient, refresh: bool = False
+) -> Optional[bytes]:
+    """Body of url, read from the on-disk cache when present.
+
+    A cached page is used without touching the network; with refresh it is
+    revalidated (If-None-Match) and re-downloaded only if it changed.
+    """
+    with shelve.open(CACHE_PATH) as cache:
+        cached: Optional[Dict[str, Any]] = cache.get(url)
+    if cached is not None and not refresh:
+        return cached["body"]
+
+    headers: Optional[Dict[str, str]] = None
+    if cached is not None and cached["etag"]:
+        headers = {"If-None-Match": cached["etag"]}
+    response = await client.get(url, headers=headers)
+    if response is None:
+        return None
+    if response.status_code == 304:
+        return cached["body"]
+
+    # Stored as UTF-8, the encoding Lexbor assumes
+    body = to_utf8(response.content, response.encoding)
+    with shelve.open(CACHE_PATH) as cache:
+        cache[url] = {"etag": response.headers.get("ETag"), "body": body}
+    return body
+
+
+async def test_world_wine_page(
+    urls: Optional[List[str]] = None,
+    client: AsyncHttpxClient = _CLIENT,
+    max_concurrency: int = 5,
+    refresh: bool = False,
+) -> None:
+    """Test the extraction for the World Wine page (or any detail pages).
+
+    Pages are fetched concurrently, at most max_concurrency at a time; each
+    report is printed as soon as its page is parsed.
+    """
+    urls = urls or [WORLD_WINE_URL]
+    semaphore = asyncio.Semaphore(max_concurrency)
     parser = DoisPorUmDetailParser()
 
-    print(f"Fetching: {url}")
-    html = await client.get_text(url)
+    await asyncio.gather(
+        *(_run_one(url, semaphore, client, parser, refresh) for url in urls)
+    )
+
+
+async def _run_one(
+    url: str,
+    semaphore: asyncio.Semaphore,
+    client: AsyncHttpxClient,
+    parser: DoisPorUmDetailParser,
+    refresh: bool = False,
+) -> None:
+    """Fetch one detail page and print what the parser extracts from it."""
+    async with semaphore:
+        print(f"Fetching: {url}")
+        # Raw bytes: Lexbor decodes them while building its tree, so the body is
+        # never materialized as a Python str
+        html = await fetch_cached(url, client, refresh)
 
     if not html:
-        print("Failed to fetch HTML")
+        print(f"Failed to fetch HTML: {url}")
         return
 
-    print(f"HTML length: {len(html)}")
+    # The whole report goes out in one write, so concurrent pages don't interleave
+    lines: List[str] = [f"HTML length: {len(html)} bytes"]
 
-    # Parse with our parser
-    offer = parser.parse(html, url)
+    # Parse once: the offer and the block debug below share the tree
+    tree = parse_html(html, parser.use_bs4)
+    offer = parser.parse_tree(tree, url)
 
-    if offer:
-        print("\n=== EXTRACTED DATA ===")
-        print(f"ID: {offer.id}")
-        print(f"Title: {offer.title}")
-        print(f"Offer: {offer.offer}")
-        print(f"Description: {offer.description[:200]}...")
-        print(f"Address: {offer.address}")
-        print(f"Phone: {offer.phone}")
-        print(f"Website: {offer.website}")
-        print(f"Images: {offer.images}")
+    # A dead page has nothing worth debugging: skip the block walk and scans
+    if offer is None:
+        lines.append(f"Parser returned None: {url}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
+
+    lines += [
+        "\n=== EXTRACTED DATA ===",
+        f"ID: {offer.id}",
+        f"Title: {offer.title}",
+        f"Offer: {offer.offer}",
+        f"Description: {offer.description[:200]}...",
+        f"Address: {offer.address}",
+        f"Phone: {offer.phone}",
+        f"Website: {offer.website}",
+        f"Images: {offer.images}",
+    ]
 
     # Let's also debug the text blocks extraction
-    soup = BeautifulSoup(html, "lxml")
-    blocks = parser._extract_text_blocks(soup)
+    blocks: List[str] = parser._extract_text_blocks(tree)
 
-    print(f"\n=== ALL TEXT BLOCKS ({len(blocks)}) ===")
+    # One pass fills both sections: longer blocks, and address-like blocks
+    # (CEP or address indicator, classified by the scraper's own block scan)
+    long_lines: List[str] = []
+    address_lines: List[str] = []
     for i, block in enumerate(blocks):
-        if len(block) > 50:  # Only show longer blocks
-            print(f"{i}: {block[:100]}...")
+        if len(block) > 50:
+            long_lines.append(f"{i}: {block[:100]}...")
+        if _scan_block(block) & _BIT_ADDRESS_LIKE:
+            address_lines.append(f"Block {i} (len={len(block)}): {block}")
 
-    # Look specifically for address-like blocks
-    print(f"\n=== ADDRESS-LIKE BLOCKS ===")
-    import re
+    lines.append(f"\n=== ALL TEXT BLOCKS ({len(blocks)}) ===")
+    lines += long_lines
+    lines.append("\n=== ADDRESS-LIKE BLOCKS ===")
+    lines += address_lines
 
-    CEP_PATTERN = r"\b\d{5}-\d{3}\b"
-    ADDRESS_INDICATORS = r"Rua|Av\.?|R\.|Al\.?|Largo|Praça|Praca|Rod\."
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    for i, block in enumerate(blocks):
-        if re.search(CEP_PATTERN, block) or re.search(
-            ADDRESS_INDICATORS, block, re.IGNORECASE
-        ):
-            print(f"Block {i} (len={len(block)}): {block}")
+
+def test_aiohttp_client_decodes_non_utf8_body() -> None:
+    """A Latin-1 page, declared or not, is decoded instead of raising."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    body = "<p>Praça São João</p>".encode("latin-1")
+
+    async def latin1(request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="text/html", charset="iso-8859-1")
+
+    async def undeclared(request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="text/html")
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get("/latin1", latin1)
+        app.router.add_get("/undeclared", undeclared)
+        client = AiohttpClient(rate_limit_seconds=0)
+        async with TestServer(app) as server:
+            try:
+                declared = await client.get_text(str(server.make_url("/latin1")))
+                guessed = await client.get_text(str(server.make_url("/undeclared")))
+            finally:
+                await client.aclose()
+        assert declared == "<p>Praça São João</p>"
+        assert guessed is not None and guessed.startswith("<p>Pra")
+
+    asyncio.run(run())
+
+
+async def main() -> None:
+    """Run the debug fetch, then release the shared client's connections."""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help=f"Revalidate pages cached in {CACHE_PATH} instead of reusing them as-is",
+    )
+    args = arg_parser.parse_args()
+
+    try:
+        await test_world_wine_page(refresh=args.refresh)
+    finally:
+        await _CLIENT.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(test_world_wine_page())
+    # uvloop.install() is deprecated; the loop factory selects it for this run only
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)